@@ -1,50 +1,70 @@
 """
 Uygulama yapılandırma dosyası
+
+Ayarlar değiştirilemez NamedTuple örnekleri olarak tutulur;
+erişim sözlük anahtarı yerine nitelik üzerinden yapılır
+(ör. DATA_COLLECTION.delay).
 """
 
+from typing import NamedTuple, Tuple
+
+
 # Veri toplama ayarları
-DATA_COLLECTION = {
-    'delay': 1.5,  # İstekler arası bekleme süresi (saniye)
-    'max_results_per_query': 30,  # Her sorgu için maksimum sonuç
-    'timeout': 30  # İstek timeout süresi (saniye)
-}
+class DataCollection(NamedTuple):
+    delay: float = 1.5  # İstekler arası bekleme süresi (saniye)
+    max_results_per_query: int = 30  # Her sorgu için maksimum sonuç
+    timeout: int = 30  # İstek timeout süresi (saniye)
+
+
+DATA_COLLECTION = DataCollection()
 
 # Arama sorguları (ana uygulamada kullanılacak)
-DEFAULT_QUERIES = [
+DEFAULT_QUERIES: Tuple[str, ...] = (
     "machine learning",
     "deep learning",
     "neural networks",
     "natural language processing",
     "computer vision"
-]
+)
+
 
 # Veri işleme ayarları
-DATA_PROCESSING = {
-    'min_citations': 0,  # Minimum atıf sayısı filtresi
-    'min_publications': 1  # Minimum yayın sayısı filtresi
-}
+class DataProcessing(NamedTuple):
+    min_citations: int = 0  # Minimum atıf sayısı filtresi
+    min_publications: int = 1  # Minimum yayın sayısı filtresi
+
+
+DATA_PROCESSING = DataProcessing()
+
 
 # Ağ analizi ayarları
-NETWORK_ANALYSIS = {
-    'top_authors_for_network': 50,  # Ağ görselleştirmesi için kullanılacak yazar sayısı
-    'min_coauthorships': 1,  # Minimum ortak yazarlık sayısı
-    'community_algorithm': 'louvain'  # 'louvain' veya 'girvan_newman'
-}
+class NetworkAnalysis(NamedTuple):
+    top_authors_for_network: int = 50  # Ağ görselleştirmesi için kullanılacak yazar sayısı
+    min_coauthorships: int = 1  # Minimum ortak yazarlık sayısı
+    community_algorithm: str = 'louvain'  # 'louvain' veya 'girvan_newman'
+
+
+NETWORK_ANALYSIS = NetworkAnalysis()
+
 
 # ML analizi ayarları
-ML_ANALYSIS = {
-    'n_clusters': 5,  # Kümeleme için küme sayısı
-    'test_size': 0.2,  # Test seti oranı
-    'random_state': 42  # Rastgelelik için seed
-}
+class MLAnalysis(NamedTuple):
+    n_clusters: int = 5  # Kümeleme için küme sayısı
+    test_size: float = 0.2  # Test seti oranı
+    random_state: int = 42  # Rastgelelik için seed
+
+
+ML_ANALYSIS = MLAnalysis()
+
 
 # Dosya yolları
-PATHS = {
-    'data_dir': 'data',
-    'results_dir': 'results',
-    'publications_csv': 'data/publications.csv',
-    'impact_scores_csv': 'results/author_impact_scores.csv',
-    'network_metrics_csv': 'results/network_metrics.csv',
-    'network_visualization': 'results/citation_network.png'
-}
+class Paths(NamedTuple):
+    data_dir: str = 'data'
+    results_dir: str = 'results'
+    publications_csv: str = 'data/publications.csv'
+    impact_scores_csv: str = 'results/author_impact_scores.csv'
+    network_metrics_csv: str = 'results/network_metrics.csv'
+    network_visualization: str = 'results/citation_network.png'
+
 
+PATHS = Paths()
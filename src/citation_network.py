@@ -8,12 +8,307 @@ Bu modül, yazarlar arası ortak yazarlık ilişkilerini analiz eder:
 - Ağı görselleştirir
 """
 
+import hashlib
+import re
+import warnings
 import networkx as nx
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from scipy import sparse
+
+# Numba import (opsiyonel - yoksa saf Python Brandes kullanılır)
+try:
+    from numba import njit, prange, get_num_threads
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# python-igraph import (opsiyonel - varsa centrality ve topluluk tespiti C kütüphanesinde yapılır)
+try:
+    import igraph as ig
+    IGRAPH_AVAILABLE = True
+except ImportError:
+    IGRAPH_AVAILABLE = False
+
+# Numba JIT derleme maliyetine değmeyecek kadar küçük ağlar için eşik
+NUMBA_MIN_NODES = 300
+
+# Bu düğüm sayısından büyük ağlarda betweenness kaynak örneklemesi ile tahmin edilir
+BETWEENNESS_EXACT_MAX_NODES = 1000
+BETWEENNESS_SAMPLES = 500
+
+# Girvan-Newman (O(V²E)) bu düğüm sayısından büyük ağlarda Louvain'e düşer
+GIRVAN_NEWMAN_MAX_NODES = 200
+
+# Yazar isimlerindeki ardışık boşlukları (tab, çoklu boşluk) tek boşluğa indirir
+_WS_RE = re.compile(r'\s+')
+
+# Görselleştirme kutu stilleri (matplotlib set_bbox sözlüğü kopyaladığı için paylaşılabilir)
+LABEL_BBOX_STYLE = dict(boxstyle='round,pad=0.6',
+                        facecolor='#FFE5E5',  # Açık kırmızı arka plan
+                        edgecolor='#FF6B6B',  # Kırmızı kenar
+                        linewidth=2,
+                        alpha=0.95)
+INFO_BBOX_STYLE = dict(boxstyle='round,pad=1.0',
+                       facecolor='#E8F4F8',
+                       edgecolor='#2C5F7D',
+                       linewidth=2,
+                       alpha=0.95)
+LEGEND_BBOX_STYLE = dict(boxstyle='round,pad=1.0',
+                         facecolor='#FFF9E6',
+                         edgecolor='#D4A574',
+                         linewidth=2,
+                         alpha=0.95)
+FOOTER_BBOX_STYLE = dict(boxstyle='round,pad=0.5',
+                         facecolor='#F5F5F5',
+                         edgecolor='#CCCCCC',
+                         linewidth=1,
+                         alpha=0.8)
+
+
+def _pagerank_csr(
+    A: sparse.csr_array,
+    alpha: float = 0.85,
+    max_iter: int = 100,
+    tol: float = 1.0e-6
+) -> np.ndarray:
+    """
+    CSR komşuluk matrisi üzerinde PageRank (power iteration)
+
+    nx.pagerank ile aynı formülasyon: ağırlıklı geçiş olasılıkları,
+    dangling düğümler için uniform dağılım ve L1 yakınsama kontrolü.
+
+    Args:
+        A: Simetrik (yönsüz) ağırlıklı komşuluk matrisi
+        alpha: Sönümleme faktörü
+        max_iter: Maksimum iterasyon sayısı
+        tol: Yakınsama toleransı
+
+    Returns:
+        Düğüm indeksine göre PageRank değerleri
+    """
+    n = A.shape[0]
+    out_weight = np.asarray(A.sum(axis=1)).ravel()
+    is_dangling = out_weight == 0
+    inv_weight = np.zeros(n)
+    inv_weight[~is_dangling] = 1.0 / out_weight[~is_dangling]
+
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        xlast = x
+        # A simetrik olduğu için x @ (D^-1 A) == A @ (D^-1 x)
+        x = alpha * (A @ (xlast * inv_weight) + xlast[is_dangling].sum() / n) + (1 - alpha) / n
+        if np.abs(x - xlast).sum() < n * tol:
+            return x
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+def _eigenvector_csr(A: sparse.csr_array, max_iter: int = 100, tol: float = 1.0e-6) -> np.ndarray:
+    """
+    CSR komşuluk matrisi üzerinde eigenvector centrality (power iteration)
+
+    nx.eigenvector_centrality gibi (A + I) ile iterasyon yapar ve
+    her adımda L2 normuna göre normalize eder.
+
+    Args:
+        A: Komşuluk matrisi
+        max_iter: Maksimum iterasyon sayısı
+        tol: Yakınsama toleransı
+
+    Returns:
+        Düğüm indeksine göre eigenvector centrality değerleri
+    """
+    n = A.shape[0]
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        xlast = x
+        x = xlast + A @ xlast
+        x = x / (np.linalg.norm(x) or 1.0)
+        if np.abs(x - xlast).sum() < n * tol:
+            return x
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+def _betweenness_csr(indptr: np.ndarray, indices: np.ndarray, sources: np.ndarray) -> np.ndarray:
+    """
+    CSR komşuluk yapısı üzerinde Brandes betweenness centrality
+
+    Ağırlıksız; verilen kaynak düğümlerden yapılan BFS'lerin ham
+    (normalize edilmemiş) bağımlılık toplamlarını döndürür.
+    Kaynak başına BFS tamponları bir kez ayrılır; her kaynakta yalnızca
+    önceki BFS'in dokunduğu düğümler sıfırlanır.
+
+    Args:
+        indptr: CSR satır işaretçileri
+        indices: CSR komşu indeksleri
+        sources: BFS başlatılacak kaynak düğüm indeksleri
+
+    Returns:
+        Düğüm indeksine göre ham betweenness değerleri
+    """
+    n = len(indptr) - 1
+    indptr = indptr.tolist()
+    indices = indices.tolist()
+
+    betweenness = [0.0] * n
+    sigma = [0.0] * n
+    dist = [-1] * n
+    delta = [0.0] * n
+    preds = [[] for _ in range(n)]
+    order = []  # BFS sırası (kuyruk olarak da kullanılır)
+
+    for s in sources.tolist():
+        # Önceki kaynağın dokunduğu tamponları yerinde sıfırla
+        for v in order:
+            sigma[v] = 0.0
+            dist[v] = -1
+            delta[v] = 0.0
+            preds[v].clear()
+        order.clear()
+
+        sigma[s] = 1.0
+        dist[s] = 0
+        order.append(s)
+        head = 0
+        while head < len(order):
+            v = order[head]
+            head += 1
+            next_dist = dist[v] + 1
+            sigma_v = sigma[v]
+            for w in indices[indptr[v]:indptr[v + 1]]:
+                if dist[w] < 0:
+                    dist[w] = next_dist
+                    order.append(w)
+                if dist[w] == next_dist:
+                    sigma[w] += sigma_v
+                    preds[w].append(v)
+
+        # Bağımlılıkları ters BFS sırasında biriktir
+        for w in reversed(order):
+            coeff = (1.0 + delta[w]) / sigma[w]
+            for v in preds[w]:
+                delta[v] += sigma[v] * coeff
+            if w != s:
+                betweenness[w] += delta[w]
+
+    return np.array(betweenness)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _betweenness_numba(indptr, indices, sources, n_chunks):
+        """
+        _betweenness_csr'ın Numba ile derlenmiş paralel sürümü
+
+        Kaynak düğümler (sources) n_chunks parçaya bölünür; her parça kendi
+        BFS tamponlarını ve kendi betweenness satırını kullanır (atomik
+        işlem gerekmez), sonuçlar en sonda toplanır. Predecessor listesi
+        yerine ters geçişte dist[w] == dist[v] + 1 kontrolü yapılır.
+        """
+        n = indptr.shape[0] - 1
+        partial = np.zeros((n_chunks, n))
+
+        for c in prange(n_chunks):
+            sigma = np.zeros(n)
+            dist = np.full(n, -1, dtype=np.int32)
+            delta = np.zeros(n)
+            order = np.empty(n, dtype=np.int32)
+            count = 0
+
+            for k in range(c, sources.shape[0], n_chunks):
+                s = sources[k]
+                for i in range(count):
+                    v = order[i]
+                    sigma[v] = 0.0
+                    dist[v] = -1
+                    delta[v] = 0.0
+
+                sigma[s] = 1.0
+                dist[s] = 0
+                order[0] = s
+                count = 1
+                head = 0
+                while head < count:
+                    v = order[head]
+                    head += 1
+                    for j in range(indptr[v], indptr[v + 1]):
+                        w = indices[j]
+                        if dist[w] < 0:
+                            dist[w] = dist[v] + 1
+                            order[count] = w
+                            count += 1
+                        if dist[w] == dist[v] + 1:
+                            sigma[w] += sigma[v]
+
+                for i in range(count - 1, 0, -1):
+                    v = order[i]
+                    for j in range(indptr[v], indptr[v + 1]):
+                        w = indices[j]
+                        if dist[w] == dist[v] + 1:
+                            delta[v] += sigma[v] / sigma[w] * (1.0 + delta[w])
+                    partial[c, v] += delta[v]
+
+        return partial.sum(axis=0)
+
+
+def _sample_sources(n: int, k: Optional[int] = None, seed: int = 42) -> np.ndarray:
+    """
+    Betweenness için kaynak düğüm indekslerini seçer
+
+    Args:
+        n: Düğüm sayısı
+        k: Örneklenecek kaynak sayısı (None veya k >= n: tüm düğümler)
+        seed: Örnekleme için rastgelelik seed'i
+
+    Returns:
+        Sıralı kaynak düğüm indeksleri
+    """
+    if k is None or k >= n:
+        return np.arange(n, dtype=np.int32)
+    rng = np.random.default_rng(seed)
+    return np.sort(rng.choice(n, size=k, replace=False)).astype(np.int32)
+
+
+def _normalize_betweenness(raw: np.ndarray, n: int, n_sources: int) -> np.ndarray:
+    """
+    Ham betweenness toplamlarını nx.betweenness_centrality ölçeğine getirir
+
+    Örneklemeli hesapta sonuç ayrıca n/k ile ölçeklenir (networkx'in k= parametresi gibi).
+    """
+    if n > 2:
+        raw = raw * (1.0 / ((n - 1) * (n - 2)) * (n / n_sources))
+    return raw
+
+
+def _betweenness(adjacency: sparse.csr_array, k: Optional[int] = None) -> np.ndarray:
+    """
+    Normalize edilmiş betweenness centrality (nx.betweenness_centrality ile aynı ölçek)
+
+    k verilirse yalnızca k rastgele kaynak düğümden BFS yapılır (örneklemeli tahmin).
+    Büyük ağlarda Numba çekirdeği, diğer durumlarda saf Python Brandes kullanılır.
+
+    Args:
+        adjacency: CSR komşuluk matrisi
+        k: Örneklenecek kaynak düğüm sayısı (None: tüm düğümler, kesin sonuç)
+
+    Returns:
+        Düğüm indeksine göre betweenness değerleri
+    """
+    n = adjacency.shape[0]
+    sources = _sample_sources(n, k)
+
+    if NUMBA_AVAILABLE and n >= NUMBA_MIN_NODES:
+        betweenness = _betweenness_numba(
+            adjacency.indptr, adjacency.indices, sources, min(get_num_threads(), len(sources))
+        )
+    else:
+        betweenness = _betweenness_csr(adjacency.indptr, adjacency.indices, sources)
+
+    return _normalize_betweenness(betweenness, n, len(sources))
 
 
 class CitationNetworkAnalyzer:
@@ -32,6 +327,8 @@ class CitationNetworkAnalyzer:
         self.publications_df = publications_df
         self.authors_df = authors_df
         self.coauthorship_graph = nx.Graph()  # Ortak yazarlık ağı
+        self._metrics_cache: Dict[Tuple[bytes, Optional[int]], pd.DataFrame] = {}  # (ağ imzası, n_samples) -> metrikler
+        self._layout_cache: Dict[Tuple, Dict] = {}  # (alt graf yapısı, iterasyon) -> düğüm pozisyonları
     
     def build_coauthorship_network(self) -> nx.Graph:
         """
@@ -44,48 +341,159 @@ class CitationNetworkAnalyzer:
             Ortak yazarlık ağı (NetworkX Graph)
         """
         self.coauthorship_graph = nx.Graph()
-        
-        # Her yayındaki yazarları işle
-        for idx, row in self.publications_df.iterrows():
-            authors = row.get('authors', [])
-            
-            # En az 2 yazar olmalı (ortak yazarlık için)
-            if not authors or len(authors) < 2:
-                continue
-            
-            # Yazar isimlerini normalize et (küçük harf, boşluk temizleme)
-            normalized_authors = []
-            for author in authors:
-                if isinstance(author, str):
-                    normalized = author.lower().strip()
-                    normalized = normalized.replace('  ', ' ')
-                    normalized_authors.append(normalized)
-            
-            # Her yazar çifti arasında edge oluştur
-            # Örnek: [A, B, C] -> (A-B), (A-C), (B-C) bağlantıları
-            for i in range(len(normalized_authors)):
-                for j in range(i + 1, len(normalized_authors)):
-                    author1 = normalized_authors[i]
-                    author2 = normalized_authors[j]
-                    
-                    if self.coauthorship_graph.has_edge(author1, author2):
-                        # Edge zaten varsa, ağırlığı artır (ortak yayın sayısı)
-                        self.coauthorship_graph[author1][author2]['weight'] += 1
-                        self.coauthorship_graph[author1][author2]['publications'].append(
-                            row.get('title', '')
-                        )
-                    else:
-                        # Yeni edge oluştur
-                        self.coauthorship_graph.add_edge(
-                            author1, 
-                            author2,
-                            weight=1,  # İlk ortak yayın
-                            publications=[row.get('title', '')]
-                        )
-        
+        self._metrics_cache.clear()
+        self._layout_cache.clear()
+
+        if self.publications_df.empty or 'authors' not in self.publications_df.columns:
+            return self.coauthorship_graph
+
+        # Her yazarı ayrı satıra aç (yayın id'si ile birlikte)
+        pubs = pd.DataFrame({
+            'title': self.publications_df.get('title', ''),
+            'authors': self.publications_df['authors']
+        }).reset_index(drop=True)
+        pubs['pid'] = pubs.index
+        exploded = pubs.explode('authors')
+        exploded = exploded[exploded['authors'].map(type).eq(str)]
+
+        # Yazar isimlerini normalize et (küçük harf, boşluk temizleme)
+        exploded['author'] = (
+            exploded['authors'].str.strip().str.lower().str.replace(_WS_RE.pattern, ' ', regex=True)
+        )
+        # Aynı yayında tekrar eden yazarlar ağırlığı şişirmesin
+        exploded = exploded.drop_duplicates(subset=['pid', 'author'])
+
+        # Aynı yayındaki her yazar çifti arasında edge oluştur (self-merge)
+        # Örnek: [A, B, C] -> (A-B), (A-C), (B-C) bağlantıları
+        pairs = exploded[['pid', 'title', 'author']].merge(
+            exploded[['pid', 'author']],
+            on='pid',
+            suffixes=('1', '2')
+        )
+        pairs = pairs[pairs['author1'] < pairs['author2']]
+
+        # Edge ağırlığı = ortak yayın sayısı
+        edges = pairs.groupby(['author1', 'author2'], sort=False).agg(
+            weight=('title', 'size'),
+            publications=('title', list)
+        )
+
+        # Tüm edge'leri (ağırlık + yayın listesi) tek toplu çağrıda ekle
+        self.coauthorship_graph.add_edges_from(
+            (author1, author2, {'weight': weight, 'publications': publications})
+            for (author1, author2), weight, publications in zip(
+                edges.index, edges['weight'].tolist(), edges['publications']
+            )
+        )
+
         return self.coauthorship_graph
-    
-    def calculate_network_metrics(self) -> pd.DataFrame:
+
+    def _adjacency_csr(self) -> Tuple[List[str], sparse.csr_array]:
+        """
+        Ortak yazarlık ağının CSR komşuluk matrisini oluşturur
+
+        Düğümler tamsayı indekslere eşlenir; centrality hesapları
+        string anahtarlı dict'ler yerine bu matris üzerinde yapılır.
+
+        Returns:
+            (düğüm listesi, simetrik ağırlıklı komşuluk matrisi)
+        """
+        nodes = list(self.coauthorship_graph.nodes())
+        node_index = {node: i for i, node in enumerate(nodes)}
+        n = len(nodes)
+
+        edges = list(self.coauthorship_graph.edges(data='weight', default=1))
+        rows = np.fromiter((node_index[u] for u, _, _ in edges), dtype=np.int32, count=len(edges))
+        cols = np.fromiter((node_index[v] for _, v, _ in edges), dtype=np.int32, count=len(edges))
+        data = np.fromiter((w for _, _, w in edges), dtype=float, count=len(edges))
+
+        A = sparse.csr_array((data, (rows, cols)), shape=(n, n))
+        return nodes, (A + A.T).tocsr()
+
+    def _to_igraph(self, adjacency: sparse.csr_array) -> "ig.Graph":
+        """
+        CSR komşuluk matrisinden igraph grafı oluşturur
+
+        igraph düğüm indeksleri _adjacency_csr düğüm listesi ile aynı sıradadır.
+
+        Args:
+            adjacency: Simetrik ağırlıklı komşuluk matrisi
+
+        Returns:
+            Ağırlıklı, yönsüz igraph grafı ('weight' edge özniteliği ile)
+        """
+        upper = sparse.triu(adjacency).tocoo()
+        return ig.Graph(
+            n=adjacency.shape[0],
+            edges=list(zip(upper.row.tolist(), upper.col.tolist())),
+            edge_attrs={'weight': upper.data.tolist()}
+        )
+
+    def _igraph_centralities(
+        self,
+        adjacency: sparse.csr_array,
+        n_samples: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Centrality metriklerini igraph (C) ile hesaplar
+
+        Sonuçlar networkx varsayılanları ile aynı ölçeğe getirilir:
+        - betweenness: ağırlıksız, normalize (örneklemeli ise n/k ölçekli)
+        - closeness: Wasserman-Faust düzeltmesi ((r-1)/(n-1), r = bileşen boyutu)
+        - eigenvector: ağırlıksız, L2 normuna göre normalize
+        - pagerank: ağırlıklı
+
+        Args:
+            adjacency: Simetrik ağırlıklı komşuluk matrisi
+            n_samples: Betweenness için örneklenecek kaynak sayısı
+
+        Returns:
+            (betweenness, closeness, eigenvector, pagerank) dizileri
+        """
+        n = adjacency.shape[0]
+        graph = self._to_igraph(adjacency)
+
+        sources = _sample_sources(n, n_samples)
+        # igraph yönsüz grafta her (s, t) çiftini bir kez sayar; nx sıralı çiftleri sayar
+        raw_betweenness = 2.0 * np.array(graph.betweenness(
+            directed=False,
+            sources=None if len(sources) == n else sources.tolist()
+        ))
+        betweenness = _normalize_betweenness(raw_betweenness, n, len(sources))
+
+        membership = np.array(graph.connected_components().membership)
+        component_sizes = np.bincount(membership)[membership]
+        closeness = np.nan_to_num(np.array(graph.closeness(normalized=True)))
+        if n > 1:
+            closeness *= (component_sizes - 1) / (n - 1)
+
+        eigenvector = np.array(graph.eigenvector_centrality(scale=True))
+        eigenvector /= np.linalg.norm(eigenvector) or 1.0
+
+        pagerank = np.array(graph.pagerank(weights='weight'))
+
+        return betweenness, closeness, eigenvector, pagerank
+
+    def _graph_signature(self) -> bytes:
+        """
+        Ağın yapısal imzasını hesaplar
+
+        Düğüm/kenar sayısı ve sıralı (kenar, ağırlık) listesinin blake2b
+        özeti. Metrik önbelleğinin anahtarı olarak kullanılır.
+
+        Returns:
+            Ağ imzası (bytes)
+        """
+        graph = self.coauthorship_graph
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{graph.number_of_nodes()}|{graph.number_of_edges()}".encode())
+        for u, v, w in sorted(
+            (min(u, v), max(u, v), w) for u, v, w in graph.edges(data='weight', default=1)
+        ):
+            digest.update(f"{u}\x00{v}\x00{w}\n".encode())
+        return digest.digest()
+
+    def calculate_network_metrics(self, n_samples: Optional[int] = None) -> pd.DataFrame:
         """
         Ağ metriklerini hesaplar
         
@@ -97,39 +505,65 @@ class CitationNetworkAnalyzer:
         - eigenvector_centrality: Önemli yazarlarla bağlantı
         - pagerank: Genel önem skoru
         
+        Sonuçlar ağ imzasına göre önbelleğe alınır; ağ değişmediği sürece
+        tekrar eden çağrılar centrality hesaplarını yeniden yapmaz.
+        
+        Args:
+            n_samples: Betweenness için örneklenecek kaynak düğüm sayısı.
+                       None ise BETWEENNESS_EXACT_MAX_NODES düğümden küçük ağlarda
+                       kesin hesap yapılır, daha büyük ağlarda BETWEENNESS_SAMPLES
+                       kaynakla tahmin edilir (örneklenmiş değerler yaklaşıktır).
+        
         Returns:
             Yazar metriklerini içeren DataFrame
         """
         if len(self.coauthorship_graph.nodes()) == 0:
             self.build_coauthorship_network()
-        
-        metrics = []
+
+        n_nodes = self.coauthorship_graph.number_of_nodes()
+        if n_samples is None and n_nodes >= BETWEENNESS_EXACT_MAX_NODES:
+            n_samples = min(BETWEENNESS_SAMPLES, n_nodes)
+
+        cache_key = (self._graph_signature(), n_samples)
+        if cache_key in self._metrics_cache:
+            return self._metrics_cache[cache_key].copy()
         
         # Ağ metriklerini hesapla
-        degree_centrality = nx.degree_centrality(self.coauthorship_graph)
-        betweenness_centrality = nx.betweenness_centrality(self.coauthorship_graph)
-        closeness_centrality = nx.closeness_centrality(self.coauthorship_graph)
-        eigenvector_centrality = nx.eigenvector_centrality(
-            self.coauthorship_graph, 
-            max_iter=1000
-        )
-        pagerank = nx.pagerank(self.coauthorship_graph)
-        
-        # Yazar istatistikleri ile birleştir
-        for node in self.coauthorship_graph.nodes():
-            degree = self.coauthorship_graph.degree(node)
-            
-            metrics.append({
-                'author_name': node,
-                'degree': degree,
-                'degree_centrality': degree_centrality.get(node, 0),
-                'betweenness_centrality': betweenness_centrality.get(node, 0),
-                'closeness_centrality': closeness_centrality.get(node, 0),
-                'eigenvector_centrality': eigenvector_centrality.get(node, 0),
-                'pagerank': pagerank.get(node, 0)
-            })
-        
-        metrics_df = pd.DataFrame(metrics)
+        # igraph varsa tüm centrality'ler C kütüphanesinde; yoksa degree, betweenness,
+        # eigenvector ve PageRank CSR matris üzerinde, closeness networkx ile hesaplanır
+        nodes, adjacency = self._adjacency_csr()
+        n = len(nodes)
+        degrees = np.diff(adjacency.indptr).astype(np.int32)
+
+        if IGRAPH_AVAILABLE:
+            betweenness, closeness, eigenvector, pagerank = self._igraph_centralities(
+                adjacency, n_samples
+            )
+        else:
+            # Eigenvector centrality ağırlıksız hesaplanır (nx varsayılanı)
+            unweighted = adjacency.copy()
+            unweighted.data = np.ones_like(unweighted.data)
+
+            betweenness = _betweenness(adjacency, k=n_samples)
+            closeness_centrality = nx.closeness_centrality(self.coauthorship_graph)
+            closeness = np.fromiter((closeness_centrality[node] for node in nodes), dtype=float, count=n)
+            eigenvector = _eigenvector_csr(unweighted, max_iter=1000)
+            pagerank = _pagerank_csr(adjacency)
+
+        degree_scale = 1.0 / (n - 1) if n > 1 else 1.0
+
+        # Metrikler düğüm indeksine göre hizalı dizilerden doğrudan kolon olarak kurulur
+        # Centrality'ler float32 (anlamlı hassasiyet ~6 basamak), yazar adları categorical
+        author_dtype = pd.CategoricalDtype(categories=nodes)
+        metrics_df = pd.DataFrame({
+            'author_name': pd.Categorical(nodes, dtype=author_dtype),
+            'degree': degrees,
+            'degree_centrality': (degrees * degree_scale).astype(np.float32),
+            'betweenness_centrality': betweenness.astype(np.float32),
+            'closeness_centrality': closeness.astype(np.float32),
+            'eigenvector_centrality': eigenvector.astype(np.float32),
+            'pagerank': pagerank.astype(np.float32)
+        })
         
         # author_name kolonunu korumak için kopyala
         author_names = metrics_df['author_name'].copy()
@@ -151,6 +585,10 @@ class CitationNetworkAnalyzer:
             # Aynı yazar için birden fazla satır olabilir - unique yazarları al
             # Her yazar için ilk satırı al (veya aggregate yap)
             authors_unique = authors_for_merge.drop_duplicates(subset=['author_name'], keep='first')
+            # Aynı categorical tip: merge string yerine tamsayı kodlar üzerinden yapılır.
+            # Ağda olmayan yazarlar left merge'de zaten eşleşmez; tipe çevirmeden önce çıkarılır.
+            authors_unique = authors_unique[authors_unique['author_name'].isin(author_dtype.categories)]
+            authors_unique = authors_unique.astype({'author_name': author_dtype})
             
             merged = pd.merge(
                 metrics_df,
@@ -162,6 +600,8 @@ class CitationNetworkAnalyzer:
         elif 'author_name' in self.authors_df.columns:
             # author_name varsa direkt merge et, ama önce unique yazarları al
             authors_unique = self.authors_df.drop_duplicates(subset=['author_name'], keep='first')
+            authors_unique = authors_unique[authors_unique['author_name'].isin(author_dtype.categories)]
+            authors_unique = authors_unique.astype({'author_name': author_dtype})
             
             merged = pd.merge(
                 metrics_df,
@@ -177,10 +617,11 @@ class CitationNetworkAnalyzer:
         if 'author_name' not in merged.columns:
             merged['author_name'] = author_names.values[:len(merged)]
         
-        # Son kontrol: duplicate'leri kaldır (güvenlik için)
-        merged = merged.drop_duplicates(subset=['author_name'], keep='first')
-        
-        return merged
+        # Tekilleştirme yalnızca authors_df tarafında bir kez yapılır: metrics_df her düğüm
+        # için tek satırdır ve tekil yazarlarla left merge yeni duplicate üretemez
+
+        self._metrics_cache[cache_key] = merged
+        return merged.copy()
     
     def find_research_communities(self, algorithm: str = 'louvain') -> Dict:
         """
@@ -190,7 +631,8 @@ class CitationNetworkAnalyzer:
         Topluluk tespiti için Louvain veya Girvan-Newman algoritması kullanılır.
         
         Args:
-            algorithm: Topluluk tespit algoritması ('louvain' veya 'girvan_newman')
+            algorithm: Topluluk tespit algoritması ('louvain', 'girvan_newman' veya
+                       'louvain_legacy' - eski python-louvain best_partition yolu)
             
         Returns:
             Topluluk ID'sine göre yazar listelerini içeren dict
@@ -201,12 +643,14 @@ class CitationNetworkAnalyzer:
         
         # Algoritma seçimi
         if algorithm == 'louvain':
+            communities = self._louvain_communities()
+        elif algorithm == 'louvain_legacy':
             try:
                 import community as community_louvain
                 communities = community_louvain.best_partition(self.coauthorship_graph)
             except ImportError:
-                print("python-louvain kütüphanesi bulunamadı. Girvan-Newman algoritması kullanılıyor.")
-                communities = self._girvan_newman_communities()
+                print("python-louvain kütüphanesi bulunamadı. Louvain (networkx) kullanılıyor.")
+                communities = self._louvain_communities()
         elif algorithm == 'girvan_newman':
             communities = self._girvan_newman_communities()
         else:
@@ -219,15 +663,44 @@ class CitationNetworkAnalyzer:
         
         return dict(community_dict)
     
+    def _louvain_communities(self) -> Dict:
+        """
+        Louvain algoritması ile topluluk bulma
+
+        igraph varsa C uygulaması (community_multilevel), yoksa
+        networkx.community.louvain_communities kullanılır. İkisi de
+        her düğüm taşıması için modülerliği baştan hesaplamak yerine
+        topluluk derece toplamlarını önbelleğe alıp ΔQ değerini hesaplar.
+
+        Returns:
+            {node: community_id} formatında dict
+        """
+        if IGRAPH_AVAILABLE:
+            nodes, adjacency = self._adjacency_csr()
+            membership = self._to_igraph(adjacency).community_multilevel(weights='weight').membership
+            return dict(zip(nodes, membership))
+
+        louvain_communities = nx.community.louvain_communities(
+            self.coauthorship_graph, weight='weight', seed=42
+        )
+        return {node: i for i, comm in enumerate(louvain_communities) for node in comm}
+
     def _girvan_newman_communities(self) -> Dict:
         """
         Girvan-Newman algoritması ile topluluk bulma
         
-        Edge betweenness'e göre toplulukları ayırır.
+        Edge betweenness'e göre toplulukları ayırır. Algoritma O(V²E) olduğu
+        için GIRVAN_NEWMAN_MAX_NODES düğümden büyük ağlarda Louvain kullanılır.
         
         Returns:
             {node: community_id} formatında dict
         """
+        n_nodes = self.coauthorship_graph.number_of_nodes()
+        if n_nodes > GIRVAN_NEWMAN_MAX_NODES:
+            print(f"[WARNING] Girvan-Newman {n_nodes} dugumlu ag icin cok yavas "
+                  f"(limit: {GIRVAN_NEWMAN_MAX_NODES}). Louvain kullaniliyor.")
+            return self._louvain_communities()
+
         communities_generator = nx.community.girvan_newman(self.coauthorship_graph)
         
         # İlk iterasyonu al (en iyi bölünme)
@@ -251,8 +724,6 @@ class CitationNetworkAnalyzer:
             En çok bağlantıya sahip yazarları içeren DataFrame
         """
         metrics_df = self.calculate_network_metrics()
-        # Duplicate'leri kaldır (her yazar için sadece bir satır)
-        metrics_df = metrics_df.drop_duplicates(subset=['author_name'], keep='first')
         top_connectors = metrics_df.nlargest(top_n, 'degree')
         return top_connectors
     
@@ -262,7 +733,9 @@ class CitationNetworkAnalyzer:
         figsize: Tuple[int, int] = (24, 16),
         node_size_factor: float = 800,
         save_path: str = None,
-        min_edge_weight: int = 2  # Sadece güçlü bağlantıları göster
+        min_edge_weight: int = 2,  # Sadece güçlü bağlantıları göster
+        layout_iterations: int = 100,  # Küçük alt graflarda layout çok daha erken yakınsar
+        show: bool = True  # False ise pencere açılmaz (sadece dosyaya kaydet)
     ):
         """Ağı görselleştirir - Sadeleştirilmiş ve okunabilir versiyon"""
         if len(self.coauthorship_graph.nodes()) == 0:
@@ -270,8 +743,6 @@ class CitationNetworkAnalyzer:
         
         # En önemli yazarları seç (PageRank'e göre - daha iyi önem ölçüsü)
         metrics_df = self.calculate_network_metrics()
-        # Duplicate'leri kaldır (güvenlik için)
-        metrics_df = metrics_df.drop_duplicates(subset=['author_name'], keep='first')
         top_authors_list = metrics_df.nlargest(top_authors, 'pagerank')['author_name'].tolist()
         
         # Alt grafi oluştur
@@ -295,17 +766,8 @@ class CitationNetworkAnalyzer:
             return
         
         # Toplulukları bul (renklendirme için)
-        try:
-            import community.community_louvain as community_louvain
-            communities = community_louvain.best_partition(subgraph)
-        except:
-            # community modülü yoksa, degree'e göre grupla
-            communities = {}
-            degrees = dict(subgraph.degree())
-            sorted_nodes = sorted(degrees.items(), key=lambda x: x[1], reverse=True)
-            num_communities = min(10, len(sorted_nodes))
-            for idx, (node, _) in enumerate(sorted_nodes):
-                communities[node] = idx % num_communities
+        subgraph_communities = nx.community.louvain_communities(subgraph, weight='weight', seed=42)
+        communities = {node: i for i, comm in enumerate(subgraph_communities) for node in comm}
         
         # Renk paleti (daha canlı renkler)
         import matplotlib.cm as cm
@@ -314,27 +776,43 @@ class CitationNetworkAnalyzer:
         node_colors = [colors[communities.get(node, 0) % len(colors)] for node in subgraph.nodes()]
         
         # Layout - Daha iyi dağılım için (daha fazla boşluk)
-        try:
-            pos = nx.spring_layout(subgraph, k=3, iterations=200, weight='weight', seed=42)
-        except:
+        # Aynı alt graf tekrar çizilirse önbellekteki layout kullanılır
+        layout_key = (
+            frozenset(subgraph.nodes()),
+            frozenset(subgraph.edges(data='weight')),
+            layout_iterations
+        )
+        pos = self._layout_cache.get(layout_key)
+        if pos is None:
             try:
-                pos = nx.kamada_kawai_layout(subgraph, weight='weight')
+                pos = nx.spring_layout(subgraph, k=3, iterations=layout_iterations, weight='weight', seed=42)
             except:
-                pos = nx.spring_layout(subgraph, k=2, iterations=100)
-        
-        # Çizim
-        fig, ax = plt.subplots(figsize=figsize, facecolor='white')
+                try:
+                    pos = nx.kamada_kawai_layout(subgraph, weight='weight')
+                except:
+                    pos = nx.spring_layout(subgraph, k=2, iterations=100)
+            self._layout_cache[layout_key] = pos
+        
+        # Çizim. Sadece dosyaya kaydedilecekse figür pyplot'a kaydedilmeden
+        # oluşturulur: GUI backend'i kurulmaz ve global backend değişmez
+        headless = bool(save_path) and not show
+        if headless:
+            fig = Figure(figsize=figsize, facecolor='white')
+            ax = fig.add_subplot()
+        else:
+            fig, ax = plt.subplots(figsize=figsize, facecolor='white')
         
         # Node boyutları (sadece PageRank'e göre - daha anlamlı)
-        pagerank_values = nx.pagerank(subgraph)
+        # PageRank tüm ağ için zaten hesaplandı; alt grafın düğümlerine filtrele
+        pagerank_series = metrics_df.set_index('author_name')['pagerank']
+        pagerank_values = pagerank_series.reindex(list(subgraph.nodes())).fillna(0).to_dict()
         max_pr = max(pagerank_values.values()) if pagerank_values.values() else 1
         
-        node_sizes = []
-        for node in subgraph.nodes():
-            pr = pagerank_values.get(node, 0)
-            # PageRank'e göre boyut (normalize edilmiş)
-            size = (pr / max_pr) * node_size_factor + 300  # Minimum 300
-            node_sizes.append(size)
+        # PageRank'e göre boyut (normalize edilmiş), minimum 300
+        node_sizes = [
+            (pagerank_values.get(node, 0) / max_pr) * node_size_factor + 300
+            for node in subgraph.nodes()
+        ]
         
         # Edge ağırlıkları ve renkleri
         edges = subgraph.edges()
@@ -345,7 +823,7 @@ class CitationNetworkAnalyzer:
         # Sadece güçlü bağlantıları daha kalın göster
         edge_widths = [min(w / max_weight * 3, 2.5) for w in weights]
         
-        nx.draw_networkx_edges(
+        edge_collection = nx.draw_networkx_edges(
             subgraph,
             pos,
             width=edge_widths,
@@ -354,21 +832,22 @@ class CitationNetworkAnalyzer:
             style='solid',
             ax=ax
         )
+        # Kenar katmanı raster olarak kaydedilir; düğümler ve yazılar vektör kalır
+        edge_collection.set_rasterized(True)
         
         # En önemli node'ları belirle (PageRank'e göre)
         important_nodes = sorted(pagerank_values.items(), key=lambda x: x[1], reverse=True)[:15]
         important_node_names = [node for node, _ in important_nodes]
+        important_node_set = set(important_node_names)
         
         # Node'ları çiz - önemli node'lar daha belirgin
-        node_colors_final = []
-        node_edge_widths = []
-        for node in subgraph.nodes():
-            if node in important_node_names:
-                node_colors_final.append('#FF6B6B')  # Kırmızı - önemli
-                node_edge_widths.append(3.0)
-            else:
-                node_colors_final.append(node_colors[list(subgraph.nodes()).index(node)])
-                node_edge_widths.append(1.5)
+        # node_colors subgraph.nodes() sırasında olduğundan zip ile eşleştirilir
+        is_important = [node in important_node_set for node in subgraph.nodes()]
+        node_colors_final = [
+            '#FF6B6B' if important else base_color  # Kırmızı - önemli
+            for important, base_color in zip(is_important, node_colors)
+        ]
+        node_edge_widths = [3.0 if important else 1.5 for important in is_important]
         
         nx.draw_networkx_nodes(
             subgraph, 
@@ -398,11 +877,7 @@ class CitationNetworkAnalyzer:
             ax.text(x, y, label, 
                    fontsize=12,
                    ha='center', va='center',
-                   bbox=dict(boxstyle='round,pad=0.6', 
-                           facecolor='#FFE5E5',  # Açık kırmızı arka plan
-                           edgecolor='#FF6B6B',  # Kırmızı kenar
-                           linewidth=2,
-                           alpha=0.95),
+                   bbox=LABEL_BBOX_STYLE,
                    fontweight='bold',
                    color='#8B0000')  # Koyu kırmızı yazı
         
@@ -434,11 +909,7 @@ class CitationNetworkAnalyzer:
                transform=ax.transAxes,
                fontsize=12,
                verticalalignment='top',
-               bbox=dict(boxstyle='round,pad=1.0', 
-                        facecolor='#E8F4F8', 
-                        edgecolor='#2C5F7D', 
-                        linewidth=2, 
-                        alpha=0.95),
+               bbox=INFO_BBOX_STYLE,
                color='#1a1a1a')
         
         # Legend/Efsane - Sağ üst
@@ -463,11 +934,7 @@ class CitationNetworkAnalyzer:
                fontsize=11,
                verticalalignment='top',
                ha='right',
-               bbox=dict(boxstyle='round,pad=1.0', 
-                        facecolor='#FFF9E6', 
-                        edgecolor='#D4A574', 
-                        linewidth=2, 
-                        alpha=0.95),
+               bbox=LEGEND_BBOX_STYLE,
                color='#1a1a1a')
         
         # Alt açıklama - Alt kısım
@@ -481,18 +948,25 @@ class CitationNetworkAnalyzer:
                ha='center', va='bottom',
                style='italic',
                color='#666666',
-               bbox=dict(boxstyle='round,pad=0.5', 
-                        facecolor='#F5F5F5', 
-                        edgecolor='#CCCCCC', 
-                        linewidth=1, 
-                        alpha=0.8))
+               bbox=FOOTER_BBOX_STYLE)
+        
+        ax.axis('off')
         
-        plt.axis('off')
+        # Başlık/lejanttaki emoji'ler yazı tipinde yoksa matplotlib her glif için
+        # (kaydederken ve yerleşimi hesaplarken) uyarır
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', message='Glyph .* missing from font', category=UserWarning)
+            if save_path:
+                fig.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
+                print(f"[OK] Gorsellestirme {save_path} dosyasina kaydedildi.")
+            if not headless:
+                fig.tight_layout()
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
-            print(f"[OK] Gorsellestirme {save_path} dosyasina kaydedildi.")
+        if headless:
+            return
         
-        plt.tight_layout()
-        plt.show()
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
 
@@ -10,12 +10,61 @@ Toplanan veriler:
 - Yayın URL'leri
 """
 
+import asyncio
+import json
+import os
+import sqlite3
 import time
 import ast
 import re
 from typing import List, Dict, Optional
 import pandas as pd
 import requests
+from tqdm import tqdm
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Eşzamanlı oturumun bağlantı havuzu sınırları
+AIOHTTP_CONNECTION_LIMIT = 64
+AIOHTTP_CONNECTION_LIMIT_PER_HOST = 10
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    from aiolimiter import AsyncLimiter
+    AIOLIMITER_AVAILABLE = True
+except ImportError:
+    AIOLIMITER_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Semantic Scholar rate limitleri: (istek sayısı, saniye)
+API_RATE_LIMIT = (100, 300)
+API_RATE_LIMIT_WITH_KEY = (5000, 300)
+
+# Arama isteklerinde istenen alanlar (paperId sorgular arası tekrarları ayıklamak için)
+SEARCH_FIELDS = 'paperId,title,abstract,authors,citationCount,externalIds,url'
+
+# CSV'den okunan "['Author1', 'Author2']" string'lerindeki tırnaklı isimler
+_QUOTED_AUTHORS = re.compile(r"['\"]([^'\"]+)['\"]")
+
+
+def _decode_json(raw):
+    """JSON gövdesini (bytes veya str) orjson varsa onunla, yoksa json ile çözer"""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
 
 
 class ScholarDataCollector:
@@ -30,7 +79,11 @@ class ScholarDataCollector:
         self, 
         api_key: Optional[str] = None,
         delay: float = 3.0,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        max_concurrency: int = 5,
+        cache_path: Optional[str] = None,
+        cache_ttl: float = 86400.0,
+        stream_path: Optional[str] = None
     ):
         """
         Args:
@@ -40,22 +93,107 @@ class ScholarDataCollector:
             delay: İstekler arası bekleme süresi (saniye)
                    Rate limit'i aşmamak için minimum 3 saniye önerilir
             timeout: Her API isteği için timeout süresi (saniye)
+            max_concurrency: Asenkron modda aynı anda açık olabilecek
+                             maksimum API isteği sayısı
+            cache_path: Başarılı API yanıtlarının saklanacağı SQLite dosyası
+                        (None ise önbellek kullanılmaz)
+            cache_ttl: Önbellekteki yanıtların geçerlilik süresi (saniye)
+            stream_path: Toplanan yayınların sorgu tamamlandıkça satır satır
+                         yazılacağı JSONL dosyası (None ise yayınlar bellekte
+                         biriktirilir). Bu modda collected_publications
+                         doldurulmaz (boş liste); yayınlar döndürülen
+                         DataFrame'de ve JSONL dosyasındadır
         """
         self.api_key = api_key
         self.delay = delay
         self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        # Asenkron limitler event loop'a bağlıdır; her loop için yeniden oluşturulur
+        self._limits_loop = None
+        self._request_semaphore = None
+        self._rate_limiter = None
+        self.cache_ttl = cache_ttl
+        self._cache_conn = self._open_cache(cache_path) if cache_path else None
+        self.stream_path = stream_path
         self.collected_publications = []
+        # Önbellekten değil API'den yanıtlanan istek sayısı; rate limit beklemeleri
+        # sadece bu sayı arttıysa yapılır (önbellekten gelen yanıtlar beklemez)
+        self._api_request_count = 0
         self.api_base_url = "https://api.semanticscholar.org/graph/v1"
+        # Her istekte aynı kalan başlıklar ve arama parametreleri bir kez oluşturulur
+        self._headers = {
+            'User-Agent': 'Academic Analysis Tool',
+            'Accept': 'application/json'
+        }
+        if api_key:
+            self._headers['x-api-key'] = api_key
+        self._search_params_template = {'fields': SEARCH_FIELDS}
         
         print("[OK] Semantic Scholar API modu aktif")
         if api_key:
             print("[OK] API key kullanılıyor (yüksek rate limit)")
     
+    @staticmethod
+    def _open_cache(cache_path: str) -> sqlite3.Connection:
+        """
+        Yanıt önbelleği için SQLite bağlantısını açar (tablo yoksa oluşturur)
+        
+        Args:
+            cache_path: SQLite dosya yolu
+            
+        Returns:
+            SQLite bağlantısı
+        """
+        cache_dir = os.path.dirname(cache_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        
+        conn = sqlite3.connect(cache_path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, created REAL NOT NULL, body TEXT NOT NULL)"
+        )
+        conn.commit()
+        return conn
+    
+    @staticmethod
+    def _cache_key(endpoint: str, params: Optional[Dict]) -> str:
+        """(endpoint, sıralı parametreler) ikilisinden önbellek anahtarı üretir"""
+        return json.dumps([endpoint, sorted((params or {}).items())], default=str)
+    
+    def _get_cached_response(self, endpoint: str, params: Optional[Dict]) -> Optional[Dict]:
+        """
+        Önbellekte süresi dolmamış bir yanıt varsa döndürür
+        
+        Returns:
+            Önbellekteki API yanıtı veya None
+        """
+        if self._cache_conn is None:
+            return None
+        
+        row = self._cache_conn.execute(
+            "SELECT body FROM responses WHERE key = ? AND created >= ?",
+            (self._cache_key(endpoint, params), time.time() - self.cache_ttl)
+        ).fetchone()
+        return _decode_json(row[0]) if row else None
+    
+    def _store_response(self, endpoint: str, params: Optional[Dict], data: Dict):
+        """Başarılı bir API yanıtını önbelleğe yazar"""
+        if self._cache_conn is None:
+            return
+        
+        self._cache_conn.execute(
+            "INSERT OR REPLACE INTO responses (key, created, body) VALUES (?, ?, ?)",
+            (self._cache_key(endpoint, params), time.time(), json.dumps(data))
+        )
+        self._cache_conn.commit()
+    
     def _api_request(self, endpoint: str, params: Dict = None, max_retries: int = 3) -> Optional[Dict]:
         """
         Semantic Scholar API'ye HTTP isteği gönderir
         
         Retry mekanizması ile rate limiting ve timeout hatalarını yönetir.
+        Önbellek açıksa, daha önce alınmış yanıtlar istek atılmadan döndürülür.
         
         Args:
             endpoint: API endpoint (örn: 'paper/search')
@@ -65,14 +203,13 @@ class ScholarDataCollector:
         Returns:
             API yanıtı (JSON dict) veya None (hata durumunda)
         """
-        url = f"{self.api_base_url}/{endpoint}"
-        headers = {
-            'User-Agent': 'Academic Analysis Tool',
-            'Accept': 'application/json'
-        }
+        cached = self._get_cached_response(endpoint, params)
+        if cached is not None:
+            return cached
         
-        if self.api_key:
-            headers['x-api-key'] = self.api_key
+        self._api_request_count += 1
+        url = f"{self.api_base_url}/{endpoint}"
+        headers = self._headers
         
         for attempt in range(max_retries):
             try:
@@ -92,7 +229,9 @@ class ScholarDataCollector:
                         return None
                 
                 response.raise_for_status()
-                return response.json()
+                data = _decode_json(response.content)
+                self._store_response(endpoint, params, data)
+                return data
                 
             except requests.exceptions.Timeout:
                 if attempt < max_retries - 1:
@@ -104,7 +243,8 @@ class ScholarDataCollector:
                     print(f"  [ERROR] Timeout hatasi: {max_retries} deneme sonrasi basarisiz")
                     return None
                     
-            except requests.exceptions.RequestException as e:
+            except (requests.exceptions.RequestException, ValueError) as e:
+                # ValueError: bozuk/yarım JSON gövdesi (json ve orjson hataları)
                 if attempt < max_retries - 1:
                     wait_time = (attempt + 1) * 2
                     print(f"  [WAIT] Hata: {e}. {wait_time} saniye bekleniyor... (Deneme {attempt + 1}/{max_retries})")
@@ -116,43 +256,184 @@ class ScholarDataCollector:
         
         return None
     
-    def _parse_api_paper(self, paper_data: Dict) -> Optional[Dict]:
+    async def _api_request_async(
+        self,
+        session: 'aiohttp.ClientSession',
+        endpoint: str,
+        params: Dict = None,
+        max_retries: int = 3
+    ) -> Optional[Dict]:
         """
-        API'den gelen yayın verisini standart formata dönüştürür
+        _api_request'in asenkron (aiohttp) versiyonu
+        
+        Aynı retry mantığını kullanır; bekleme süreleri event loop'u
+        bloklamadan asyncio.sleep ile yapılır.
         
         Args:
-            paper_data: API'den gelen ham yayın verisi (dict)
+            session: Paylaşılan aiohttp oturumu
+            endpoint: API endpoint (örn: 'paper/search')
+            params: İstek parametreleri
+            max_retries: Maksimum retry sayısı
             
         Returns:
-            Standart formatta yayın verisi (dict) veya None
-        """
-        # Yazar isimlerini çıkar
-        authors = []
-        if 'authors' in paper_data:
-            authors = [author.get('name', '') for author in paper_data['authors'] if author.get('name')]
-        
-        # Atıf sayısı
-        citation_count = paper_data.get('citationCount', 0) or 0
-        
-        # Yayın URL'si (öncelik: DOI, sonra direkt URL)
-        url = ""
-        if 'externalIds' in paper_data and 'DOI' in paper_data['externalIds']:
-            url = f"https://doi.org/{paper_data['externalIds']['DOI']}"
-        elif 'url' in paper_data:
-            url = paper_data['url']
-        
-        return {
-            'title': paper_data.get('title', ''),
-            'abstract': paper_data.get('abstract', ''),
-            'authors': authors,
-            'citation_count': citation_count,
-            'pub_url': url
-        }
+            API yanıtı (JSON dict) veya None (hata durumunda)
+        """
+        self._api_request_count += 1
+        url = f"{self.api_base_url}/{endpoint}"
+        headers = self._headers
+        
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        
+        for attempt in range(max_retries):
+            try:
+                async with session.get(url, params=params, headers=headers, timeout=timeout) as response:
+                    # 429 hatası (Rate Limit) - bekleyip tekrar dene
+                    if response.status == 429:
+                        retry_after = int(response.headers.get('Retry-After', 60))
+                        wait_time = min(retry_after, 120)
+                        
+                        if attempt < max_retries - 1:
+                            print(f"  [WAIT] Rate limit asildi! {wait_time} saniye bekleniyor... (Deneme {attempt + 1}/{max_retries})")
+                            await asyncio.sleep(wait_time)
+                            continue
+                        else:
+                            print(f"  [ERROR] Rate limit hatasi: {max_retries} deneme sonrasi basarisiz")
+                            return None
+                    
+                    response.raise_for_status()
+                    data = _decode_json(await response.read())
+                    self._store_response(endpoint, params, data)
+                    return data
+                
+            except asyncio.TimeoutError:
+                if attempt < max_retries - 1:
+                    wait_time = (attempt + 1) * 5
+                    print(f"  [WAIT] Timeout! {wait_time} saniye bekleniyor... (Deneme {attempt + 1}/{max_retries})")
+                    await asyncio.sleep(wait_time)
+                    continue
+                else:
+                    print(f"  [ERROR] Timeout hatasi: {max_retries} deneme sonrasi basarisiz")
+                    return None
+                    
+            except (aiohttp.ClientError, ValueError) as e:
+                # ValueError: bozuk/yarım JSON gövdesi (json ve orjson hataları)
+                if attempt < max_retries - 1:
+                    wait_time = (attempt + 1) * 2
+                    print(f"  [WAIT] Hata: {e}. {wait_time} saniye bekleniyor... (Deneme {attempt + 1}/{max_retries})")
+                    await asyncio.sleep(wait_time)
+                    continue
+                else:
+                    print(f"  [ERROR] API istegi hatasi: {e}")
+                    return None
+        
+        return None
+    
+    def _ensure_async_limits(self):
+        """
+        Eşzamanlılık semaforunu ve rate limiter'ı çalışan event loop için hazırlar
+        
+        asyncio nesneleri ilk kullanıldıkları loop'a bağlandığından, her
+        asyncio.run çağrısında yeniden oluşturulurlar.
+        """
+        loop = asyncio.get_running_loop()
+        if self._limits_loop is loop:
+            return
+        
+        self._limits_loop = loop
+        self._request_semaphore = asyncio.Semaphore(self.max_concurrency)
+        if AIOLIMITER_AVAILABLE:
+            max_rate, time_period = API_RATE_LIMIT_WITH_KEY if self.api_key else API_RATE_LIMIT
+            self._rate_limiter = AsyncLimiter(max_rate, time_period)
+        else:
+            self._rate_limiter = None
+    
+    async def _limited_request(
+        self,
+        session: 'aiohttp.ClientSession',
+        endpoint: str,
+        params: Dict = None,
+        stagger: float = 0.0
+    ) -> Optional[Dict]:
+        """
+        _api_request_async'i eşzamanlılık ve rate limit sınırları içinde çağırır
+        
+        Aynı anda en fazla max_concurrency istek açık olur; aiolimiter kuruluysa
+        istekler ayrıca API'nin 5 dakikalık kotasına göre token bucket ile dağıtılır,
+        yoksa istek stagger saniye kaydırılarak başlatılır. Önbellekte bulunan
+        yanıtlar kotayı harcamadan ve beklemeden döndürülür.
+        """
+        # Limitler önbellek kontrolünden önce hazırlanır: yanıt önbellekten gelse
+        # bile çağıranlar (ör. fetch_page) bu loop'un rate limiter'ını okur
+        self._ensure_async_limits()
+        
+        cached = self._get_cached_response(endpoint, params)
+        if cached is not None:
+            return cached
+        
+        if self._rate_limiter is None and stagger > 0:
+            await asyncio.sleep(stagger)
+        
+        async with self._request_semaphore:
+            if self._rate_limiter is not None:
+                async with self._rate_limiter:
+                    return await self._api_request_async(session, endpoint, params)
+            return await self._api_request_async(session, endpoint, params)
+    
+    def _parse_api_papers(self, papers: List[Dict], max_count: int, seen_ids: set) -> List[Dict]:
+        """
+        Bir API sayfasındaki ham yayın verilerini standart formata dönüştürür
+        
+        Sayfa tek döngüde işlenir. Aynı toplamada daha önce görülmüş bir
+        paperId gelirse (başka bir sorgudan dönen aynı yayın) veya başlık
+        boşsa yayın atlanır; max_count yayına ulaşınca kalan kayıtlar
+        işlenmez (ve görülmüş sayılmaz).
+        
+        Args:
+            papers: API'den gelen ham yayın verileri (dict listesi)
+            max_count: Bu sayfadan alınacak maksimum yayın sayısı
+            seen_ids: Bu toplamada görülen paperId'ler (yerinde güncellenir)
+            
+        Returns:
+            Standart formatta yayın verileri listesi
+        """
+        publications = []
+        
+        for paper_data in papers:
+            if len(publications) >= max_count:
+                break
+            
+            paper_id = paper_data.get('paperId')
+            if paper_id is not None:
+                if paper_id in seen_ids:
+                    continue
+                seen_ids.add(paper_id)
+            
+            title = paper_data.get('title', '')
+            if not title:
+                continue
+            
+            # Yayın URL'si (öncelik: DOI, sonra direkt URL)
+            external_ids = paper_data.get('externalIds')
+            if external_ids and 'DOI' in external_ids:
+                url = f"https://doi.org/{external_ids['DOI']}"
+            else:
+                url = paper_data.get('url', '')
+            
+            publications.append({
+                'title': title,
+                'abstract': paper_data.get('abstract', ''),
+                'authors': [author['name'] for author in paper_data.get('authors') or () if author.get('name')],
+                'citation_count': paper_data.get('citationCount', 0) or 0,
+                'pub_url': url
+            })
+        
+        return publications
     
     def search_publications(
         self, 
         query: str, 
-        max_results: int = 100
+        max_results: int = 100,
+        seen_ids: Optional[set] = None
     ) -> List[Dict]:
         """
         Semantic Scholar API ile yayın arama
@@ -163,58 +444,161 @@ class ScholarDataCollector:
         Args:
             query: Arama sorgusu (örn: "machine learning")
             max_results: Maksimum toplanacak yayın sayısı
+            seen_ids: Sorgular arası tekrarları ayıklamak için paylaşılan
+                      paperId kümesi (None ise sadece bu aramanın tekrarları ayıklanır)
             
         Returns:
             Yayın bilgilerini içeren liste
         """
+        if seen_ids is None:
+            seen_ids = set()
         publications = []
         offset = 0
         limit = min(100, max_results)  # API limit: maksimum 100 sonuç/istek
         
         print(f"  🔍 Semantic Scholar API'de aranıyor: '{query}'")
         
-        # Pagination ile tüm sonuçları topla
-        while len(publications) < max_results:
-            # API istek parametreleri
-            params = {
-                'query': query,
-                'limit': limit,
-                'offset': offset,
-                'fields': 'title,abstract,authors,citationCount,externalIds,url'
-            }
-            
-            # API isteği gönder
-            response_data = self._api_request('paper/search', params)
-            
-            # Hata kontrolü
-            if not response_data or 'data' not in response_data:
-                break
-            
-            papers = response_data.get('data', [])
-            if not papers:
-                break
-            
-            # Her yayını parse et ve listeye ekle
-            for paper in papers:
-                if len(publications) >= max_results:
+        # API istek parametreleri (sayfalar arasında sadece offset değişir)
+        params = {**self._search_params_template, 'query': query, 'limit': limit, 'offset': offset}
+        
+        # Pagination ile tüm sonuçları topla (ilerleme sayfa başına bir kez güncellenir)
+        with tqdm(total=max_results, desc=f"  '{query}'", unit='yayın', leave=False) as progress:
+            while len(publications) < max_results:
+                params['offset'] = offset
+                
+                # API isteği gönder
+                requests_before = self._api_request_count
+                response_data = self._api_request('paper/search', params)
+                
+                # Hata kontrolü
+                if not response_data or 'data' not in response_data:
+                    break
+                
+                papers = response_data.get('data', [])
+                if not papers:
                     break
                 
-                pub_data = self._parse_api_paper(paper)
-                if pub_data and pub_data['title']:
-                    publications.append(pub_data)
-                    print(f"  [OK] {len(publications)}/{max_results} yayın toplandı: {pub_data['title'][:50]}...", end='\r')
+                # Sayfadaki yayınları parse et ve listeye ekle
+                page_publications = self._parse_api_papers(papers, max_results - len(publications), seen_ids)
+                publications.extend(page_publications)
+                progress.update(len(page_publications))
+                
+                # Rate limiting için bekle (minimum 3 saniye); önbellekten
+                # gelen sayfalar API'ye gitmediği için beklemez
+                if self._api_request_count != requests_before:
+                    time.sleep(max(self.delay, 3.0))
+                
+                # Sonraki sayfa için offset artır
+                offset += limit
+                
+                # Eğer daha az sonuç geldiyse, daha fazla sayfa yok demektir
+                if len(papers) < limit:
+                    break
+        
+        print(f"  [OK] '{query}' sorgusu tamamlandı: {len(publications)} yayın toplandı")
+        return publications
+    
+    async def search_publications_async(
+        self,
+        session: 'aiohttp.ClientSession',
+        query: str,
+        max_results: int = 100,
+        seen_ids: Optional[set] = None
+    ) -> List[Dict]:
+        """
+        search_publications'ın asenkron versiyonu
+        
+        Args:
+            session: Paylaşılan aiohttp oturumu
+            query: Arama sorgusu
+            max_results: Maksimum toplanacak yayın sayısı
+            seen_ids: Sorgular arası paylaşılan paperId kümesi (None ise yeni küme)
             
-            # Rate limiting için bekle (minimum 3 saniye)
-            time.sleep(max(self.delay, 3.0))
+        Returns:
+            Yayın bilgilerini içeren liste
+        """
+        pages = await self._fetch_search_pages_async(session, query, max_results)
+        publications = self._parse_search_pages(
+            pages, max_results, set() if seen_ids is None else seen_ids
+        )
+        print(f"  [OK] '{query}' sorgusu tamamlandı: {len(publications)} yayın toplandı")
+        return publications
+    
+    async def _fetch_search_pages_async(
+        self,
+        session: 'aiohttp.ClientSession',
+        query: str,
+        max_results: int
+    ) -> List[Optional[Dict]]:
+        """
+        Bir sorgunun arama sonuç sayfalarını asenkron olarak indirir
+        
+        İlk sayfadan toplam sonuç sayısı öğrenildikten sonra kalan sayfalar
+        eşzamanlı istenir. İstekler _limited_request üzerinden sınırlanır;
+        aiolimiter yoksa önbellekte bulunmayan her sayfa isteği sırasına göre
+        delay kadar kaydırılarak başlatılır.
+        
+        Args:
+            session: Paylaşılan aiohttp oturumu
+            query: Arama sorgusu
+            max_results: Maksimum toplanacak yayın sayısı
             
-            # Sonraki sayfa için offset artır
-            offset += limit
+        Returns:
+            Offset sırasıyla ham API yanıtları (başarısız sayfalar None)
+        """
+        limit = min(100, max_results)  # API limit: maksimum 100 sonuç/istek
+        delay = max(self.delay, 3.0)
+        
+        query_params = {**self._search_params_template, 'query': query, 'limit': limit}
+        
+        def page_params(offset: int) -> Dict:
+            return {**query_params, 'offset': offset}
+        
+        async def fetch_page(page_idx: int, offset: int) -> Optional[Dict]:
+            # Kaydırma beklemesi önbellek kontrolünden sonra yapılır
+            return await self._limited_request(
+                session, 'paper/search', page_params(offset), stagger=page_idx * delay
+            )
+        
+        print(f"  🔍 Semantic Scholar API'de aranıyor: '{query}'")
+        
+        first_page = await self._limited_request(session, 'paper/search', page_params(0))
+        if not first_page or 'data' not in first_page:
+            return []
+        
+        pages = [first_page]
+        total = min(max_results, first_page.get('total', max_results))
+        offsets = range(limit, total, limit) if len(first_page['data']) >= limit else range(0)
+        if len(offsets) > 0:
+            pages.extend(await asyncio.gather(
+                *(fetch_page(i, offset) for i, offset in enumerate(offsets, 1))
+            ))
+        return pages
+    
+    def _parse_search_pages(
+        self,
+        pages: List[Optional[Dict]],
+        max_results: int,
+        seen_ids: set
+    ) -> List[Dict]:
+        """
+        Ham arama sayfalarını offset sırasıyla parse eder
+        
+        Args:
+            pages: Offset sırasıyla API yanıtları
+            max_results: Maksimum yayın sayısı
+            seen_ids: Bu toplamada görülen paperId'ler (yerinde güncellenir)
             
-            # Eğer daha az sonuç geldiyse, daha fazla sayfa yok demektir
-            if len(papers) < limit:
+        Returns:
+            Yayın bilgilerini içeren liste (daha önce görülen yayınlar hariç)
+        """
+        publications = []
+        for response_data in pages:
+            if not response_data or 'data' not in response_data:
                 break
-        
-        print(f"\n  [OK] '{query}' sorgusu tamamlandı: {len(publications)} yayın toplandı")
+            publications.extend(
+                self._parse_api_papers(response_data['data'], max_results - len(publications), seen_ids)
+            )
         return publications
     
     def collect_multiple_queries(
@@ -235,39 +619,182 @@ class ScholarDataCollector:
         Returns:
             Tüm sorgulardan toplanan yayınların DataFrame'i
         """
+        # aiohttp varsa ve çalışan bir event loop yoksa sorgular eşzamanlı çalışır
+        if AIOHTTP_AVAILABLE and not self._in_running_loop():
+            return asyncio.run(self.collect_multiple_queries_async(queries, max_results_per_query))
+        
         all_publications = []
+        total_collected = 0
+        seen_ids = set()  # Bu toplamada görülen paperId'ler (sorgular arası tekrarlar)
+        stream = self._open_stream()
         
         print(f"\n[INFO] Toplam {len(queries)} sorgu işlenecek")
         print(f"[INFO] Her istek icin timeout: {self.timeout} saniye")
         print(f"[INFO] Her sorgu icin maksimum {max_results_per_query} sonuc\n")
         
         # Her sorgu için arama yap
-        for idx, query in enumerate(queries, 1):
-            print(f"\n{'='*60}")
-            print(f"Sorgu {idx}/{len(queries)}: '{query}'")
-            print(f"{'='*60}")
+        try:
+            for idx, query in enumerate(queries, 1):
+                print(f"\n{'='*60}")
+                print(f"Sorgu {idx}/{len(queries)}: '{query}'")
+                print(f"{'='*60}")
+                
+                requests_before = self._api_request_count
+                try:
+                    publications = self.search_publications(query, max_results_per_query, seen_ids)
+                    total_collected += len(publications)
+                    if stream:
+                        self._write_stream(stream, publications)
+                    else:
+                        all_publications.extend(publications)
+                    print(f"[OK] Sorgu {idx} tamamlandı: {len(publications)} yayın toplandı")
+                except Exception as e:
+                    print(f"[ERROR] Sorgu {idx} basarisiz: {e}")
+                    continue
+                
+                # Sorgular arası bekleme (API rate limit: 100 istek/5 dakika);
+                # sorgu tamamen önbellekten yanıtlandıysa beklenmez
+                if idx < len(queries) and self._api_request_count != requests_before:
+                    wait_time = 10  # Rate limit'i aşmamak için 10 saniye bekle
+                    print(f"[WAIT] Sonraki sorgu icin {wait_time} saniye bekleniyor...")
+                    time.sleep(wait_time)
+        finally:
+            if stream:
+                stream.close()
+        
+        return self._publications_to_dataframe(all_publications, total_collected)
+    
+    async def collect_multiple_queries_async(
+        self,
+        queries: List[str],
+        max_results_per_query: int = 50
+    ) -> pd.DataFrame:
+        """
+        collect_multiple_queries'in asenkron versiyonu
+        
+        Tüm sorgular tek bir aiohttp oturumu üzerinden eşzamanlı çalıştırılır;
+        aynı anda açık istek sayısı max_concurrency ile sınırlıdır. Her sorgu
+        tamamlandığında parse edilip (stream modunda) diske yazılır; sorgu
+        sırasının korunması için sadece sırası henüz gelmemiş sorguların ham
+        sayfaları bellekte bekletilir.
+        
+        Args:
+            queries: Arama sorguları listesi
+            max_results_per_query: Her sorgu için maksimum sonuç sayısı
             
+        Returns:
+            Tüm sorgulardan toplanan yayınların DataFrame'i
+        """
+        all_publications = []
+        total_collected = 0
+        seen_ids = set()  # Bu toplamada görülen paperId'ler (sorgular arası tekrarlar)
+        
+        print(f"\n[INFO] Toplam {len(queries)} sorgu eşzamanlı işlenecek (en fazla {self.max_concurrency} açık istek)")
+        print(f"[INFO] Her istek icin timeout: {self.timeout} saniye")
+        print(f"[INFO] Her sorgu icin maksimum {max_results_per_query} sonuc\n")
+        
+        connector = aiohttp.TCPConnector(
+            limit=AIOHTTP_CONNECTION_LIMIT,
+            limit_per_host=AIOHTTP_CONNECTION_LIMIT_PER_HOST
+        )
+        async def fetch_query(idx: int, query: str):
             try:
-                publications = self.search_publications(query, max_results_per_query)
-                all_publications.extend(publications)
-                print(f"[OK] Sorgu {idx} tamamlandı: {len(publications)} yayın toplandı")
+                return idx, await self._fetch_search_pages_async(session, query, max_results_per_query)
             except Exception as e:
-                print(f"[ERROR] Sorgu {idx} basarisiz: {e}")
-                continue
-            
-            # Sorgular arası bekleme (API rate limit: 100 istek/5 dakika)
-            if idx < len(queries):
-                wait_time = 10  # Rate limit'i aşmamak için 10 saniye bekle
-                print(f"[WAIT] Sonraki sorgu icin {wait_time} saniye bekleniyor...")
-                time.sleep(wait_time)
+                return idx, e
+        
+        # Sayfalar sorgu sırasıyla parse edilir; sorgular arası tekrarlar
+        # tamamlanma sırasından bağımsız olarak ilk sorguda kalır. Erken biten
+        # sorgular, önceki sorgular tamamlanana kadar pending'de bekler.
+        pending = {}
+        next_idx = 1
+        stream = self._open_stream()
+        try:
+            async with aiohttp.ClientSession(connector=connector) as session:
+                for completed in asyncio.as_completed(
+                    [fetch_query(idx, query) for idx, query in enumerate(queries, 1)]
+                ):
+                    idx, pages = await completed
+                    pending[idx] = pages
+                    
+                    while next_idx in pending:
+                        pages = pending.pop(next_idx)
+                        if isinstance(pages, Exception):
+                            print(f"[ERROR] Sorgu {next_idx} basarisiz: {pages}")
+                        else:
+                            publications = self._parse_search_pages(pages, max_results_per_query, seen_ids)
+                            total_collected += len(publications)
+                            if stream:
+                                self._write_stream(stream, publications)
+                            else:
+                                all_publications.extend(publications)
+                            print(f"[OK] Sorgu {next_idx} tamamlandı: {len(publications)} yayın toplandı")
+                        next_idx += 1
+        finally:
+            if stream:
+                stream.close()
+        
+        return self._publications_to_dataframe(all_publications, total_collected)
+    
+    @staticmethod
+    def _in_running_loop() -> bool:
+        """Çağrı zaten çalışan bir event loop içinden mi yapılıyor (ör. Jupyter)?"""
+        try:
+            asyncio.get_running_loop()
+            return True
+        except RuntimeError:
+            return False
+    
+    def _open_stream(self):
+        """
+        stream_path ayarlıysa JSONL dosyasını yazmak için açar
+        
+        Returns:
+            Açık dosya nesnesi (stream_path None ise None)
+        """
+        if not self.stream_path:
+            return None
+        
+        stream_dir = os.path.dirname(self.stream_path)
+        if stream_dir:
+            os.makedirs(stream_dir, exist_ok=True)
+        return open(self.stream_path, 'w', encoding='utf-8')
+    
+    @staticmethod
+    def _write_stream(stream, publications: List[Dict]):
+        """Yayınları JSONL dosyasına her satıra bir yayın olacak şekilde ekler"""
+        stream.writelines(json.dumps(pub, ensure_ascii=False) + '\n' for pub in publications)
+        stream.flush()
+    
+    def _publications_to_dataframe(self, all_publications: List[Dict], total_collected: int) -> pd.DataFrame:
+        """
+        Toplanan yayınları DataFrame'e dönüştürür
         
+        stream_path ayarlıysa yayınlar bellekteki listeden değil, toplama
+        sırasında yazılan JSONL dosyasından tek seferde okunur ve
+        collected_publications boş bırakılır.
+        
+        Args:
+            all_publications: Yayın bilgilerini içeren liste (stream modunda boş)
+            total_collected: Toplanan yayın sayısı
+            
+        Returns:
+            Yayınların DataFrame'i (yayın yoksa boş DataFrame)
+        """
         print(f"\n{'='*60}")
-        print(f"[INFO] Toplam {len(all_publications)} yayin toplandi")
+        print(f"[INFO] Toplam {total_collected} yayin toplandi")
         print(f"{'='*60}\n")
         
         # DataFrame'e dönüştür
-        if len(all_publications) > 0:
-            df = pd.DataFrame(all_publications)
+        if self.stream_path:
+            # Yayınlar bellekte tutulmaz; önceki toplamadan kalan liste temizlenir
+            self.collected_publications = []
+        
+        if total_collected > 0 and self.stream_path:
+            df = pd.read_json(self.stream_path, lines=True, dtype=False, convert_dates=False)
+            df = self._with_arrow_authors(df)
+        elif total_collected > 0:
+            df = self._with_arrow_authors(pd.DataFrame(all_publications))
             self.collected_publications = all_publications
         else:
             print("[WARNING] Hic yayin toplanamadi! Bos DataFrame olusturuluyor...")
@@ -275,6 +802,31 @@ class ScholarDataCollector:
         
         return df
     
+    @staticmethod
+    def _with_arrow_authors(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        authors kolonunu PyArrow list<string> tipine dönüştürür
+        
+        Yazar listeleri Python list nesneleri yerine bitişik bir Arrow dizisinde
+        tutulur; explode gibi işlemler C++ tarafında çalışır. pyarrow kurulu
+        değilse veya listeler string olmayan elemanlar içeriyorsa (ör. CSV'deki
+        "['A', 1]") authors kolonu Python listeleri olarak bırakılır.
+        
+        Args:
+            df: authors kolonu Python listeleri içeren DataFrame
+            
+        Returns:
+            authors kolonu Arrow tipinde (dönüştürülebiliyorsa) DataFrame
+        """
+        if not PYARROW_AVAILABLE or 'authors' not in df.columns:
+            return df
+        
+        try:
+            df['authors'] = pd.array(df['authors'], dtype=pd.ArrowDtype(pa.list_(pa.string())))
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            print(f"[WARNING] authors kolonu Arrow listesine donusturulemedi, Python listeleri kullaniliyor: {e}")
+        return df
+    
     def save_to_csv(self, df: pd.DataFrame, filename: str = "publications.csv"):
         """
         Verileri CSV dosyasına kaydeder
@@ -283,12 +835,16 @@ class ScholarDataCollector:
             df: Kaydedilecek DataFrame
             filename: Dosya yolu
         """
+        # Arrow listeleri CSV'ye numpy formatında ("['A' 'B']") yazılır ve
+        # geri okunamaz; Python listesi formatında yazılmaları için dönüştür
+        if 'authors' in df.columns and isinstance(df['authors'].dtype, pd.ArrowDtype):
+            df = df.assign(authors=pd.Series(df['authors'].tolist(), index=df.index, dtype=object))
         df.to_csv(filename, index=False, encoding='utf-8')
         print(f"[OK] {len(df)} yayin {filename} dosyasina kaydedildi.")
     
     def load_from_csv(self, filename: str = "publications.csv") -> pd.DataFrame:
         """
-        CSV dosyasından veri yükler
+        CSV dosyasından veri yükler (eski format; yeni kayıtlar için load_from_parquet)
         
         CSV'den okunan verileri parse eder:
         - authors kolonu string'den listeye dönüştürülür
@@ -300,8 +856,6 @@ class ScholarDataCollector:
         Returns:
             Yüklenen verilerin DataFrame'i
         """
-        import os
-        
         # Dosya varlık kontrolü
         if not os.path.exists(filename):
             print(f"[WARNING] Dosya bulunamadi: {filename}")
@@ -312,7 +866,8 @@ class ScholarDataCollector:
             return pd.DataFrame()
         
         try:
-            df = pd.read_csv(filename)
+            # pyarrow varsa çok iş parçacıklı Arrow CSV okuyucusu kullanılır
+            df = pd.read_csv(filename, engine='pyarrow' if PYARROW_AVAILABLE else 'c')
             
             if df.empty or len(df) == 0:
                 print(f"[WARNING] CSV dosyasi bos: {filename}")
@@ -339,7 +894,7 @@ class ScholarDataCollector:
                             author_str = author_str.strip()
                             if author_str.startswith('[') and author_str.endswith(']'):
                                 author_str = author_str[1:-1]
-                                authors = re.findall(r"['\"]([^'\"]+)['\"]", author_str)
+                                authors = _QUOTED_AUTHORS.findall(author_str)
                                 return [a.strip() for a in authors if a.strip()]
                             # Virgülle ayrılmış string ise
                             return [a.strip() for a in author_str.split(',') if a.strip()]
@@ -353,7 +908,7 @@ class ScholarDataCollector:
             
             self.collected_publications = df.to_dict('records')
             print(f"[OK] {len(df)} yayin CSV'den yuklendi")
-            return df
+            return self._with_arrow_authors(df)
             
         except pd.errors.EmptyDataError:
             print(f"[WARNING] CSV dosyasi bos veya gecersiz: {filename}")
@@ -361,3 +916,68 @@ class ScholarDataCollector:
         except Exception as e:
             print(f"[ERROR] CSV yukleme hatasi: {e}")
             return pd.DataFrame()
+    
+    def save_to_parquet(self, df: pd.DataFrame, filename: str = "publications.parquet"):
+        """
+        Verileri Parquet dosyasına kaydeder
+        
+        Parquet, authors gibi liste kolonlarını olduğu gibi saklar; geri
+        yüklerken string parse etmek gerekmez. pyarrow kurulu değilse
+        aynı isimle CSV olarak kaydedilir.
+        
+        Args:
+            df: Kaydedilecek DataFrame
+            filename: Dosya yolu
+        """
+        if not PYARROW_AVAILABLE:
+            print("[WARNING] pyarrow bulunamadi. Veriler CSV olarak kaydediliyor.")
+            self.save_to_csv(df, os.path.splitext(filename)[0] + '.csv')
+            return
+        
+        df.to_parquet(filename, engine='pyarrow', compression='snappy', index=False)
+        print(f"[OK] {len(df)} yayin {filename} dosyasina kaydedildi.")
+    
+    def load_from_parquet(self, filename: str = "publications.parquet") -> pd.DataFrame:
+        """
+        Parquet dosyasından veri yükler
+        
+        authors kolonu Arrow list<string> olarak okunur; CSV'deki gibi
+        satır satır parse edilmez.
+        
+        Args:
+            filename: Yüklenecek Parquet dosyası yolu
+            
+        Returns:
+            Yüklenen verilerin DataFrame'i
+        """
+        if not PYARROW_AVAILABLE:
+            print("[ERROR] Parquet okumak icin pyarrow gerekli.")
+            return pd.DataFrame()
+        
+        if not os.path.exists(filename):
+            print(f"[WARNING] Dosya bulunamadi: {filename}")
+            return pd.DataFrame()
+        
+        try:
+            # Liste kolonları Arrow tipinde kalır. pandas metadata'sı yok sayılır,
+            # çünkü ArrowDtype liste tipleri metadata'dan geri okunamıyor.
+            df = pq.read_table(filename).to_pandas(
+                ignore_metadata=True,
+                types_mapper=lambda arrow_type: pd.ArrowDtype(arrow_type) if pa.types.is_list(arrow_type) else None
+            )
+            
+            if df.empty:
+                print(f"[WARNING] Parquet dosyasi bos: {filename}")
+                self.collected_publications = []
+                return pd.DataFrame()
+            
+            if 'citation_count' in df.columns:
+                df['citation_count'] = pd.to_numeric(df['citation_count'], errors='coerce').fillna(0).astype(int)
+            
+            self.collected_publications = df.to_dict('records')
+            print(f"[OK] {len(df)} yayin Parquet'ten yuklendi")
+            return self._with_arrow_authors(df)
+            
+        except Exception as e:
+            print(f"[ERROR] Parquet yukleme hatasi: {e}")
+            return pd.DataFrame()
@@ -6,8 +6,47 @@ yazar istatistiklerini hesaplar.
 """
 
 import pandas as pd
+import numpy as np
 import re
 import ast
+from typing import List, Optional
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Yazar isimlerinin başındaki/sonundaki köşeli parantez ve tırnaklar
+_STRIP_BRACKETS = re.compile(r'^[\'\"\[\]]+|[\'\"\[\]]+$')
+# Köşeli parantez içindeki tırnaklı isimler
+_QUOTED_AUTHORS = re.compile(r"['\"]([^'\"]+)['\"]")
+# İsim normalizasyonunda tek boşluğa indirilen boşluk grupları
+_WHITESPACE = re.compile(r'\s+')
+# get_top_authors'ın sıralama yapabildiği kolonlar
+_TOP_AUTHOR_SORT_COLUMNS = ('total_citations', 'publication_count', 'h_index_approx')
+
+
+def _is_arrow_list(series: pd.Series) -> bool:
+    """Series'in PyArrow liste tipinde (ör. list<string>) olup olmadığını döndürür"""
+    return (
+        PYARROW_AVAILABLE
+        and isinstance(series.dtype, pd.ArrowDtype)
+        and pa.types.is_list(series.dtype.pyarrow_dtype)
+    )
+
+
+def _normalize_name(name):
+    """İsmi küçük harfe çevirir, baş/son boşlukları atar ve iç boşlukları tek boşluğa indirir"""
+    return ' '.join(name.lower().split()) if isinstance(name, str) else name
+
+
+def _is_arrow_string(series: pd.Series) -> bool:
+    """Series'in string verisi PyArrow üzerinde mi tutuluyor?"""
+    dtype = series.dtype
+    return isinstance(dtype, pd.ArrowDtype) or (
+        isinstance(dtype, pd.StringDtype) and dtype.storage == 'pyarrow'
+    )
 
 
 class DataProcessor:
@@ -24,7 +63,8 @@ class DataProcessor:
             df: Yayın verilerini içeren DataFrame
                 Gerekli kolonlar: title, abstract, authors, citation_count
         """
-        self.df = df.copy()
+        # Girdi kopyalanmaz; clean_data sadece değiştirdiği kolonları yeniden üretir
+        self.df = df
         self.processed_df = None
     
     def clean_data(self) -> pd.DataFrame:
@@ -40,11 +80,12 @@ class DataProcessor:
         Returns:
             Temizlenmiş DataFrame
         """
-        df = self.df.copy()
+        df = self.df
         
         # Boş DataFrame kontrolü
         if df.empty or len(df) == 0:
             print("[WARNING] Uyari: Bos veri seti! Temizleme atlaniyor.")
+            df = df.copy()
             self.processed_df = df
             return df
         
@@ -57,86 +98,124 @@ class DataProcessor:
             self.processed_df = pd.DataFrame()
             return pd.DataFrame()
         
-        # Eksik değerleri temizle
-        df['title'] = df['title'].fillna('')
-        df['abstract'] = df['abstract'].fillna('')
-        df['citation_count'] = pd.to_numeric(df['citation_count'], errors='coerce').fillna(0)
-        
-        # Yazar listelerini temizle
-        df['authors'] = df['authors'].apply(self._clean_author_list)
-        
-        # Boş başlıklı yayınları kaldır
-        df = df[df['title'].str.strip() != '']
+        # Eksik değerleri ve yazar listelerini temizle. Sadece bu kolonlar yeni
+        # Series olarak üretilir; diğer kolonlar (ör. pub_url) kopyalanmadan aktarılır.
+        cleaned_columns = {
+            'title': df['title'].fillna(''),
+            'abstract': df['abstract'].fillna(''),
+            'citation_count': pd.to_numeric(df['citation_count'], errors='coerce').fillna(0).astype('int32'),
+            'authors': self._clean_author_column(df['authors'])
+        }
+        df = pd.DataFrame(
+            {col: cleaned_columns.get(col, df[col]) for col in df.columns},
+            copy=False
+        )
         
-        # Duplicate'leri kaldır (başlığa göre)
-        if len(df) > 0:
-            df = df.drop_duplicates(subset=['title'], keep='first')
+        # Boş başlıklı yayınları kaldır ve duplicate'leri kaldır (başlığa göre).
+        # Başlıklar boşluk ve büyük/küçük harf farkı gözetmeden karşılaştırılır;
+        # strip edilmiş başlık her iki filtre için bir kez hesaplanır.
+        title_key = df['title'].str.strip().str.lower()
+        df = df[(title_key != '') & ~title_key.duplicated(keep='first')]
         
         self.processed_df = df
         return df
     
-    def _clean_author_list(self, authors):
+    def _clean_author_column(self, authors: pd.Series) -> pd.Series:
         """
-        Yazar listesini temizler ve standart formata dönüştürür
+        Yazar kolonunu temizler ve her satırı standart bir listeye dönüştürür
         
-        Farklı formatlardaki yazar verilerini (string, list) temiz bir listeye dönüştürür.
+        Farklı formatlardaki yazar verilerini (string, list) temiz listelere
+        dönüştürür. Satırlar tipe göre bir kez ayrılır; liste ve virgülle
+        ayrılmış string satırları explode edilip pandas string işlemleriyle
+        birlikte temizlenir. None, NaN ve diğer tipler boş liste olur.
         
         Args:
-            authors: Yazar verisi (string, list veya None)
+            authors: Yazar verilerini içeren Series (string, list veya None)
             
         Returns:
-            Temizlenmiş yazar listesi
+            Aynı index'e sahip, temizlenmiş yazar listelerini içeren Series
+        """
+        if _is_arrow_list(authors):
+            return self._clean_arrow_author_column(authors)
+        
+        values = authors.reset_index(drop=True)
+        kinds = values.map(type)
+        is_list = kinds.eq(list)
+        is_str = kinds.eq(str)
+        
+        # Varsayılan: boş liste (None, NaN, boş string ve diğer tipler)
+        cleaned = [[] for _ in range(len(values))]
+        
+        # String satırlar: "['Author1', 'Author2']" formatı ayrıca parse edilir
+        strings = values[is_str].astype(object).str.strip()
+        bracketed = strings.str.startswith('[') & strings.str.endswith(']')
+        parsed = strings[bracketed].map(self._parse_bracketed_authors)
+        resolved = parsed[parsed.notna()]
+        for pos, author_list in resolved.items():
+            cleaned[pos] = author_list
+        
+        # Liste satırları ve virgülle ayrılmış string'ler (literal_eval'in liste
+        # döndürmediği köşeli parantezli string'ler dahil) aynı yoldan temizlenir
+        comma_separated = strings[~strings.index.isin(resolved.index)].str.split(',')
+        parts = pd.concat([values[is_list], comma_separated]).explode()
+        parts = parts[parts.map(type).eq(str)].astype(object)
+        parts = parts.str.strip().str.replace(_STRIP_BRACKETS, '', regex=True).str.strip()
+        parts = parts[parts != '']
+        # explode satır içi sırayı korur; isimler satır konumlarına geri eklenir
+        for pos, author in zip(parts.index, parts):
+            cleaned[pos].append(author)
+        
+        return pd.Series(cleaned, index=authors.index, dtype=object)
+    
+    def _clean_arrow_author_column(self, authors: pd.Series) -> pd.Series:
+        """
+        PyArrow list<string> tipindeki yazar kolonunu temizler
+        
+        Liste elemanları Arrow içinde açılır, string işlemleri Arrow
+        kernel'larıyla yapılır ve sonuç yine list<string> kolonu olarak
+        yeniden kurulur; Python listesine dönüşüm yapılmaz.
+        
+        Args:
+            authors: pd.ArrowDtype(pa.list_(pa.string())) tipinde Series
+            
+        Returns:
+            Aynı tip ve index'e sahip, temizlenmiş yazar listeleri
+        """
+        values = authors.reset_index(drop=True)
+        parts = values.explode().dropna()
+        parts = parts.str.strip().str.replace(_STRIP_BRACKETS.pattern, '', regex=True).str.strip()
+        parts = parts[parts != '']
+        
+        # explode satır sırasını korur; satır başına kalan isim sayısından offset'ler
+        counts = np.bincount(parts.index.to_numpy(), minlength=len(values))
+        offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int32)
+        names = pa.array(parts.to_numpy(dtype=object), type=pa.string())
+        cleaned = pa.ListArray.from_arrays(pa.array(offsets), names)
+        
+        return pd.Series(cleaned, index=authors.index, dtype=pd.ArrowDtype(cleaned.type))
+    
+    def _parse_bracketed_authors(self, author_str: str) -> Optional[List[str]]:
         """
-        # None veya NaN kontrolü
-        if authors is None:
-            return []
+        Köşeli parantezli yazar string'ini listeye dönüştürür
         
+        Python list formatı: "['Author1', 'Author2']"
+        
+        Args:
+            author_str: Köşeli parantezle başlayıp biten yazar string'i
+            
+        Returns:
+            Yazar listesi; string liste olarak parse edilemiyorsa None
+            (bu durumda virgülle ayırma uygulanır)
+        """
         try:
-            if pd.isna(authors):
-                return []
-        except (TypeError, ValueError):
-            pass
-        
-        # Boş string kontrolü
-        if isinstance(authors, str) and authors.strip() == '':
-            return []
-        
-        # Liste zaten temizlenmişse direkt döndür
-        if isinstance(authors, list):
-            cleaned = []
-            for author in authors:
-                if isinstance(author, str):
-                    author = author.strip()
-                    # Köşeli parantezleri ve tırnak işaretlerini temizle
-                    author = re.sub(r'^[\'\"\[\]]+|[\'\"\[\]]+$', '', author).strip()
-                    if author:
-                        cleaned.append(author)
-            return cleaned
-        
-        # String ise listeye dönüştür
-        if isinstance(authors, str):
-            author_str = authors.strip()
-            # Python list formatı: "['Author1', 'Author2']"
-            if author_str.startswith('[') and author_str.endswith(']'):
-                try:
-                    parsed = ast.literal_eval(author_str)
-                    if isinstance(parsed, list):
-                        return [a.strip() for a in parsed if isinstance(a, str) and a.strip()]
-                except (ValueError, SyntaxError):
-                    # Manuel parse: köşeli parantez içindeki isimleri çıkar
-                    author_str = author_str[1:-1]
-                    authors_list = re.findall(r"['\"]([^'\"]+)['\"]", author_str)
-                    return [a.strip() for a in authors_list if a.strip()]
-            # Virgülle ayrılmış string
-            authors_list = [a.strip() for a in author_str.split(',') if a.strip()]
-            cleaned = []
-            for a in authors_list:
-                a = re.sub(r'^[\'\"\[\]]+|[\'\"\[\]]+$', '', a).strip()
-                if a:
-                    cleaned.append(a)
-            return cleaned
-        
-        return []
+            parsed = ast.literal_eval(author_str)
+            if isinstance(parsed, list):
+                return [a.strip() for a in parsed if isinstance(a, str) and a.strip()]
+        except (ValueError, SyntaxError):
+            # Manuel parse: köşeli parantez içindeki isimleri çıkar
+            authors_list = _QUOTED_AUTHORS.findall(author_str[1:-1])
+            return [a.strip() for a in authors_list if a.strip()]
+        return None
     
     def extract_authors(self) -> pd.DataFrame:
         """
@@ -152,24 +231,17 @@ class DataProcessor:
         if self.processed_df is None:
             self.clean_data()
         
-        author_records = []
+        if self.processed_df.empty:
+            return pd.DataFrame()
         
-        # Her yayındaki yazarları çıkar
-        for idx, row in self.processed_df.iterrows():
-            authors = row['authors']
-            if not authors or len(authors) == 0:
-                continue
-            
-            # Her yazar için bir kayıt oluştur
-            for author in authors:
-                author_records.append({
-                    'author_name': author,
-                    'publication_title': row['title'],
-                    'citation_count': row['citation_count'],
-                    'abstract': row.get('abstract', '')
-                })
-        
-        authors_df = pd.DataFrame(author_records)
+        # Her yayındaki yazarları ayrı satırlara aç (yazarı olmayan yayınlar düşer)
+        authors_df = (
+            self.processed_df[['authors', 'title', 'citation_count', 'abstract']]
+            .explode('authors')
+            .dropna(subset=['authors'])
+            .rename(columns={'authors': 'author_name', 'title': 'publication_title'})
+            .reset_index(drop=True)
+        )
         return authors_df
     
     def normalize_author_names(self, authors_df: pd.DataFrame) -> pd.DataFrame:
@@ -188,10 +260,15 @@ class DataProcessor:
             Normalize edilmiş DataFrame (author_normalized kolonu eklenmiş)
         """
         # Basit normalizasyon: küçük harfe çevir, fazla boşlukları temizle
-        authors_df['author_normalized'] = authors_df['author_name'].str.lower().str.strip()
-        authors_df['author_normalized'] = authors_df['author_normalized'].str.replace(
-            r'\s+', ' ', regex=True
-        )
+        names = authors_df['author_name']
+        if _is_arrow_string(names):
+            # Arrow string kernel'ları C++'ta çalışır; ayrı geçişler yine de en hızlısı
+            authors_df['author_normalized'] = (
+                names.str.lower().str.strip().str.replace(_WHITESPACE.pattern, ' ', regex=True)
+            )
+        else:
+            # Python string'lerinde her isim tek geçişte normalize edilir
+            authors_df['author_normalized'] = names.map(_normalize_name)
         
         return authors_df
     
@@ -212,56 +289,52 @@ class DataProcessor:
             Yazar istatistiklerini içeren DataFrame
             Sıralama: total_citations'a göre azalan
         """
-        # Yazar bazında grupla ve istatistikleri hesapla
-        grouped = authors_df.groupby('author_normalized')
+        # Yazar bazında grupla ve istatistikleri hesapla. Gruplama bir kez
+        # yapılır ve üç indirgeme tarafından paylaşılır; grup anahtarları
+        # sıralanmaz, tek gerekli sıralama en sondaki total_citations sıralamasıdır.
+        grouped = authors_df.groupby('author_normalized', sort=False)
+        publication_count = grouped['publication_title'].count()
+        
+        # H-index benzeri metrik tüm yazarlar için vektörel hesaplanır
+        # H-index: En az h yayını, her biri en az h atıf almış
+        # (index'ler farklı sırada geldiğinden hizalama açıkça yapılır;
+        # DataFrame kurucusu aksi halde index birleşimini sıralar)
+        h_indices = self._calculate_h_indices(authors_df).reindex(publication_count.index)
         
         author_stats = pd.DataFrame({
-            'publication_count': grouped['publication_title'].count(),
+            'publication_count': publication_count,
             'total_citations': grouped['citation_count'].sum(),
-            'avg_citations_per_paper': grouped['citation_count'].mean()
+            'avg_citations_per_paper': grouped['citation_count'].mean(),
+            'h_index_approx': h_indices
         }).reset_index()
         
         # author_normalized'i author_name olarak değiştir
         author_stats.rename(columns={'author_normalized': 'author_name'}, inplace=True)
         
-        # H-index benzeri metrik hesapla
-        # H-index: En az h yayını, her biri en az h atıf almış
-        author_stats['h_index_approx'] = author_stats.apply(
-            lambda row: self._calculate_h_index_approx(
-                authors_df[authors_df['author_normalized'] == row['author_name']]['citation_count']
-            ),
-            axis=1
-        )
-        
         return author_stats.sort_values('total_citations', ascending=False)
     
-    def _calculate_h_index_approx(self, citations: pd.Series) -> int:
+    def _calculate_h_indices(self, authors_df: pd.DataFrame) -> pd.Series:
         """
-        Yaklaşık H-index hesaplar
+        Tüm yazarlar için yaklaşık H-index'i tek seferde hesaplar
         
         H-index: Bir yazarın en az h yayını, her biri en az h atıf almış.
+        Kayıtlar atıf sayısına göre bir kez azalan sıralanır ve her yazarın
+        yayınlarına sıra numarası verilir; sıra numarasından fazla ya da ona
+        eşit atıf almış yayınların sayısı H-index'tir (sıralı dizide bu koşul
+        bir önek boyunca sağlanır).
         
         Args:
-            citations: Yazarın yayınlarının atıf sayıları (pandas Series)
+            authors_df: author_normalized ve citation_count kolonlarını içeren DataFrame
             
         Returns:
-            H-index değeri
+            author_normalized index'li H-index Series'i
         """
-        if len(citations) == 0:
-            return 0
-        
-        # Atıf sayılarını azalan sıraya göre sırala
-        sorted_citations = sorted(citations, reverse=True)
-        h_index = 0
-        
-        # H-index hesapla: i+1. yayın en az i+1 atıf almış mı?
-        for i, cit in enumerate(sorted_citations):
-            if cit >= i + 1:
-                h_index = i + 1
-            else:
-                break
-        
-        return h_index
+        ordered = authors_df[['author_normalized', 'citation_count']].sort_values(
+            'citation_count', ascending=False, kind='stable'
+        )
+        rank = ordered.groupby('author_normalized', sort=False).cumcount() + 1
+        qualifies = ordered['citation_count'] >= rank
+        return qualifies.groupby(ordered['author_normalized'], sort=False).sum()
     
     def get_top_authors(
         self, 
@@ -280,17 +353,8 @@ class DataProcessor:
         Returns:
             En etkili yazarları içeren DataFrame
         """
-        # Güvenlik için duplicate'leri kaldır
-        authors_df = authors_df.drop_duplicates(subset=['author_name'], keep='first')
-        
-        if by == 'total_citations':
-            top = authors_df.nlargest(top_n, 'total_citations')
-        elif by == 'publication_count':
-            top = authors_df.nlargest(top_n, 'publication_count')
-        elif by == 'h_index_approx':
-            top = authors_df.nlargest(top_n, 'h_index_approx')
-        else:
-            top = authors_df.nlargest(top_n, 'total_citations')
-        
-        return top
+        # calculate_author_stats yazar başına tek satır ürettiği için tekrar
+        # ayıklama yapılmaz; bilinmeyen kriterlerde total_citations kullanılır
+        sort_column = by if by in _TOP_AUTHOR_SORT_COLUMNS else 'total_citations'
+        return authors_df.nlargest(top_n, sort_column)
 
@@ -24,6 +24,36 @@ from src.data_processor import DataProcessor
 from src.citation_network import CitationNetworkAnalyzer
 from src.ml_analyzer import MLAnalyzer
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+def save_results_csv(df: pd.DataFrame, path: str):
+    """
+    Sonuç DataFrame'ini CSV olarak kaydeder
+    
+    pyarrow kuruluysa Arrow'un C++ CSV yazıcısı kullanılır (pandas'ın
+    Python CSV yazıcısından çok daha hızlı); Arrow'a dönüştürülemeyen
+    kolonlar varsa veya pyarrow yoksa pandas to_csv'ye düşülür.
+    
+    Args:
+        df: Kaydedilecek DataFrame
+        path: CSV dosya yolu
+    """
+    if PYARROW_AVAILABLE:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pa_csv.write_csv(table, path, write_options=pa_csv.WriteOptions(quoting_style='needed'))
+            return
+        except pa.ArrowException:
+            pass
+    
+    df.to_csv(path, index=False)
+
 
 def main():
     """
@@ -50,7 +80,9 @@ def main():
     collector = ScholarDataCollector(
         api_key=None,  # Opsiyonel: API key ile rate limit artırılabilir (5000 istek/5 dakika)
         delay=3.0,     # API rate limit: 100 istek/5 dakika (her istek arası 3 saniye)
-        timeout=30.0
+        timeout=30.0,
+        cache_path="data/api_cache.sqlite",  # Tekrar çalıştırmalarda aynı istekler API'ye gitmez
+        stream_path="data/publications.jsonl"  # Yayınlar bellekte biriktirilmeden diske yazılır
     )
     
     # Örnek arama sorguları (kullanıcı bunları değiştirebilir)
@@ -64,6 +96,7 @@ def main():
     
     # Veri toplama - otomatik olarak dosya varsa üzerine yaz, yoksa oluştur
     csv_file = "data/publications.csv"
+    parquet_file = "data/publications.parquet"
     os.makedirs("data", exist_ok=True)
     
     print("\nVeri toplanıyor...")
@@ -73,6 +106,12 @@ def main():
     )
     collector.save_to_csv(df_publications, csv_file)
     
+    # pyarrow varsa yayınlar Parquet olarak da kaydedilir ve analiz bu dosyadan
+    # yüklenir; authors listeleri CSV'deki gibi string'den parse edilmez
+    if PYARROW_AVAILABLE and not df_publications.empty:
+        collector.save_to_parquet(df_publications, parquet_file)
+        df_publications = collector.load_from_parquet(parquet_file)
+    
     if df_publications.empty:
         print("[WARNING] Hic veri toplanamadi!")
         return
@@ -177,10 +216,10 @@ def main():
     
     os.makedirs("results", exist_ok=True)
     
-    impact_df.to_csv("results/author_impact_scores.csv", index=False)
-    network_metrics.to_csv("results/network_metrics.csv", index=False)
-    top_influential.to_csv("results/top_influential_authors.csv", index=False)
-    clustered_df.to_csv("results/clustered_authors.csv", index=False)
+    save_results_csv(impact_df, "results/author_impact_scores.csv")
+    save_results_csv(network_metrics, "results/network_metrics.csv")
+    save_results_csv(top_influential, "results/top_influential_authors.csv")
+    save_results_csv(clustered_df, "results/clustered_authors.csv")
     
     print("Sonuçlar 'results' klasörüne kaydedildi.")
     
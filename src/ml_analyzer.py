@@ -7,19 +7,18 @@ Bu modül, yazar istatistikleri ve ağ metriklerini kullanarak:
 - Yazarları benzerliklerine göre kümeleme yapar
 """
 
+import os
 import pandas as pd
 import numpy as np
+from joblib import Parallel, delayed
 from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
-from sklearn.cluster import KMeans, DBSCAN
+from sklearn.cluster import KMeans, MiniBatchKMeans, DBSCAN
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.tree import DecisionTreeRegressor
-from sklearn.svm import SVR
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import KFold, train_test_split
 from sklearn.metrics import r2_score, mean_squared_error
 from typing import Dict, List
 import warnings
-warnings.filterwarnings('ignore')
 
 # LightGBM import (opsiyonel - yoksa hata vermez)
 try:
@@ -29,6 +28,112 @@ except ImportError:
     LIGHTGBM_AVAILABLE = False
     print("[WARNING] LightGBM yuklu degil. 'pip install lightgbm' ile yukleyebilirsiniz.")
 
+# predict_citations'ın desteklediği modeller
+MODEL_NAMES = ('rf', 'lgbm', 'dt')
+
+# Bu yazar sayısının üzerinde KMeans yerine MiniBatchKMeans kullanılır
+MINIBATCH_KMEANS_MIN_AUTHORS = 5000
+MINIBATCH_KMEANS_BATCH_SIZE = 1024
+
+# LightGBM erken durdurma: eğitim setinden ayrılan doğrulama oranı ve sabır turu
+LGBM_VALIDATION_SIZE = 0.15
+LGBM_EARLY_STOPPING_ROUNDS = 30
+# Bu satır sayısının altında doğrulama seti ayrılmaz, erken durdurma yapılmaz
+LGBM_EARLY_STOPPING_MIN_ROWS = 200
+# Yaprak başına minimum örnek sayısının üst sınırı (LightGBM varsayılanı)
+LGBM_MIN_CHILD_SAMPLES = 20
+
+# Bu yazar sayısının altında bir model ayrıca K-fold CV ile değerlendirilir
+SMALL_SAMPLE_AUTHORS = 50
+SMALL_SAMPLE_FOLDS = 5
+# CV ile değerlendirilecek modelin seçim sırası (istenen modeller arasından ilki)
+CV_MODEL_PREFERENCE = ('lgbm', 'dt', 'rf')
+
+# Ağaç modellerinin kapasite sınırları (eğitim seti boyutuna göre ölçeklenir)
+MIN_ESTIMATORS = 50
+MAX_ESTIMATORS = 500
+MAX_TREE_DEPTH = 12
+
+# Numba import (opsiyonel - yoksa etki skoru NumPy ile hesaplanır)
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Numba çekirdeğinin NumPy'dan hızlı olduğu minimum yazar sayısı
+NUMBA_MIN_AUTHORS = 10000
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _impact_score_numba(X, w):
+        """
+        Ağırlıklı toplam ve 0-100 min-max ölçeklemeyi tek çekirdekte yapar
+
+        Satırlar paralel işlenir; her satırın ağırlıklı toplamı doğrudan çıktı
+        dizisine yazılır, ardından min/max taranır ve çıktı yerinde ölçeklenir.
+        Ara dizi oluşturulmaz.
+        """
+        n, n_features = X.shape
+        out = np.empty(n, dtype=np.float32)
+        for i in prange(n):
+            score = np.float32(0.0)
+            for j in range(n_features):
+                score += X[i, j] * w[j]
+            out[i] = score
+
+        low = out.min()
+        high = out.max()
+        if high > low:
+            scale = np.float32(100.0) / (high - low)
+            for i in prange(n):
+                out[i] = (out[i] - low) * scale
+        else:
+            out[:] = 0
+        return out
+
+
+def _tree_capacity(n_samples: int):
+    """
+    Eğitim seti boyutuna göre ağaç sayısını ve maksimum derinliği belirler
+    
+    Küçük yazar kümelerinde gereksiz ağaç/derinlik CPU harcar, büyük kümelerde
+    sabit derinlik 10 yetersiz kalır. Ağaç sayısı sqrt(N) ile, derinlik log2(N)
+    ile büyür ve sabit sınırlar içinde tutulur.
+    
+    Args:
+        n_samples: Eğitim örneği sayısı
+        
+    Returns:
+        (n_estimators, max_depth) ikilisi
+    """
+    n_estimators = min(MAX_ESTIMATORS, max(MIN_ESTIMATORS, int(np.sqrt(n_samples) * 5)))
+    max_depth = min(MAX_TREE_DEPTH, 1 + int(np.log2(max(n_samples, 2))))
+    return n_estimators, max_depth
+
+
+def _project_2d(X_centered: np.ndarray) -> np.ndarray:
+    """
+    Ortalanmış özellik matrisini ilk iki temel bileşene izdüşürür (PCA)
+    
+    Matris zaten ortalanmış olduğundan tam SVD yerine F×F boyutlu Gram
+    matrisinin özdeğer ayrışımı kullanılır (F: özellik sayısı). İşaret
+    kuralı sklearn PCA ile aynıdır: her bileşenin mutlak değerce en büyük
+    katsayısı pozitiftir.
+    
+    Args:
+        X_centered: Kolon ortalamaları sıfır olan N×F matris (F > 2)
+        
+    Returns:
+        N×2 izdüşüm matrisi
+    """
+    _, eigenvectors = np.linalg.eigh(X_centered.T @ X_centered)
+    components = eigenvectors[:, ::-1][:, :2]  # eigh özdeğerleri artan sırada döndürür
+    signs = np.sign(components[np.abs(components).argmax(axis=0), [0, 1]])
+    signs[signs == 0] = 1
+    return X_centered @ (components * signs)
+
 
 class MLAnalyzer:
     """
@@ -48,28 +153,33 @@ class MLAnalyzer:
         self.network_metrics_df = network_metrics_df
         self.scaler = StandardScaler()  # Özellik normalizasyonu için
         self.feature_df = None  # Birleştirilmiş özellik vektörü
+        # _X_scaled kolonlarına karşılık gelen temel özellikler (impact_score,
+        # cluster, pca_1, pca_2 gibi sonradan eklenen kolonlar hariç)
+        self._feature_cols = ()
+        # Tahmin ve kümelemede kullanılan özellikler (hedef total_citations hariç)
+        # ve bunların _X/_X_scaled içindeki kolon indeksleri
+        self._ml_feature_cols = ()
+        self._ml_feature_idx = None
+        self._X = None  # Ölçeklenmemiş float32 özellik matrisi (ağaç modelleri için)
+        self._X_scaled = None  # create_features'ta bir kez ölçeklenen float32 özellik matrisi
+        self._y = None  # Atıf tahmini hedefi (total_citations) float32 vektörü
+        self._impact_order = None  # feature_df satırlarının impact_score'a göre azalan sırası
+        self._features_built_from = None  # Özelliklerin üretildiği girdi DataFrame'lerinin id'leri
     
     def create_features(self) -> pd.DataFrame:
         """
         ML için özellik vektörü oluşturur
         
         Yazar istatistikleri ve ağ metriklerini birleştirerek
-        makine öğrenmesi için özellik vektörü oluşturur.
+        makine öğrenmesi için özellik vektörü oluşturur. Girdi DataFrame'leri
+        değişmediyse (aynı nesneler) önceki sonuç yeniden hesaplanmadan döndürülür.
         
         Returns:
             Özellik vektörünü içeren DataFrame
         """
-        # Merge işleminden önce duplicate'leri kaldır
-        author_stats_unique = self.author_stats_df.drop_duplicates(subset=['author_name'], keep='first')
-        network_metrics_unique = self.network_metrics_df.drop_duplicates(subset=['author_name'], keep='first')
-        
-        # İki DataFrame'i birleştir
-        merged = pd.merge(
-            author_stats_unique,
-            network_metrics_unique,
-            on='author_name',
-            how='inner'
-        )
+        inputs = (id(self.author_stats_df), id(self.network_metrics_df))
+        if self.feature_df is not None and self._features_built_from == inputs:
+            return self.feature_df
         
         # Özellikleri seç
         feature_columns = [
@@ -85,18 +195,78 @@ class MLAnalyzer:
             'pagerank'
         ]
         
+        # Merge'e sadece author_name ve özellik kolonları girer; ağ metriklerindeki
+        # yayın başlığı/özet gibi string kolonlar birleştirme sırasında taşınmaz.
+        # Duplicate'ler merge'den önce tek bir maske ile kaldırılır; yazarlar
+        # zaten tekilse (olağan durum) satır filtresi hiç uygulanmaz.
+        def unique_feature_rows(df: pd.DataFrame) -> pd.DataFrame:
+            columns = ['author_name'] + [col for col in feature_columns if col in df.columns]
+            duplicated = df['author_name'].duplicated(keep='first')
+            return df.loc[~duplicated, columns] if duplicated.any() else df[columns]
+        
+        # İki DataFrame'i birleştir (tekil anahtarların inner merge'ü tekil kalır)
+        merged = pd.merge(
+            unique_feature_rows(self.author_stats_df),
+            unique_feature_rows(self.network_metrics_df),
+            on='author_name',
+            how='inner'
+        )
+        
         # Eksik sütunları kontrol et
         available_features = [col for col in feature_columns if col in merged.columns]
         
-        self.feature_df = merged[['author_name'] + available_features].copy()
+        # Eksik değerleri doldur (sadece NaN içeren kolonlar yeniden yazılır);
+        # sonraki adımlar feature_df'in NaN içermediğini varsayar
+        na_features = [col for col in available_features if merged[col].hasnans]
+        if na_features:
+            merged[na_features] = merged[na_features].fillna(0)
+        
+        # Sayısal kolonlar 32 bit'e indirilir (ondalıklı: float32, tam sayı: int32);
+        # ML adımlarının taradığı bellek yarıya iner
+        compact_dtypes = {
+            col: np.int32 if pd.api.types.is_integer_dtype(merged[col]) else np.float32
+            for col in available_features
+        }
+        self.feature_df = merged[['author_name'] + available_features].astype(compact_dtypes)
+        
+        # Özellikler bir kez standartlaştırılır; etki skoru, tahmin ve kümeleme
+        # bu matrisi yeniden ölçeklemeden kullanır
+        self._feature_cols = tuple(available_features)
+        self._ml_feature_cols = tuple(col for col in available_features if col != 'total_citations')
+        self._ml_feature_idx = np.array(
+            [available_features.index(col) for col in self._ml_feature_cols], dtype=np.intp
+        )
+        self._X = self.feature_df[available_features].to_numpy(dtype=np.float32, copy=False)
+        self._X_scaled = self.scaler.fit_transform(self._X)
+        # Hedef vektörü bir kez float32 olarak çıkarılır; tüm modeller aynı diziyi kullanır
+        self._y = self.feature_df['total_citations'].to_numpy(dtype=np.float32, copy=False)
+        self._impact_order = None  # Yeni feature_df için etki skoru yeniden hesaplanmalı
+        self._features_built_from = inputs
         
-        # Eksik değerleri doldur
-        self.feature_df[available_features] = self.feature_df[available_features].fillna(0)
+        return self.feature_df
+    
+    def _feature_matrix(self, ml_features: bool = False, scaled: bool = True):
+        """
+        Önbellekteki özellik matrisini ve kolon isimlerini döndürür
         
-        # Son kontrol: duplicate'leri kaldır (güvenlik için)
-        self.feature_df = self.feature_df.drop_duplicates(subset=['author_name'], keep='first')
+        StandardScaler her kolonu bağımsız ölçeklediğinden, hedef kolonu
+        çıkarılmış ölçekli matris aynı kolonların ayrıca ölçeklenmesiyle aynıdır.
         
-        return self.feature_df
+        Args:
+            ml_features: True ise hedef (total_citations) hariç özellikler döndürülür
+            scaled: True ise standartlaştırılmış, False ise ham matris döndürülür
+            
+        Returns:
+            (özellik isimleri tuple'ı, float32 özellik matrisi) ikilisi
+        """
+        self.create_features()  # Girdiler değişmediyse önbellekteki sonucu kullanır
+        
+        matrix = self._X_scaled if scaled else self._X
+        if not ml_features:
+            return self._feature_cols, matrix
+        if len(self._ml_feature_cols) == len(self._feature_cols):
+            return self._ml_feature_cols, matrix
+        return self._ml_feature_cols, matrix[:, self._ml_feature_idx]
     
     def calculate_impact_score(self) -> pd.DataFrame:
         """
@@ -119,15 +289,8 @@ class MLAnalyzer:
             Etki skorları eklenmiş DataFrame (impact_score kolonu ile)
             Sıralama: impact_score'a göre azalan
         """
-        if self.feature_df is None:
-            self.create_features()
-        
-        feature_cols = [col for col in self.feature_df.columns 
-                       if col not in ['author_name']]
-        
-        # Özellikleri normalize et (standartlaştırma)
-        X = self.feature_df[feature_cols].values
-        X_scaled = self.scaler.fit_transform(X)
+        # Standartlaştırılmış özellikler (create_features'ta bir kez hesaplanır)
+        feature_cols, X_scaled = self._feature_matrix()
         
         # Ağırlıklı etki skoru hesapla
         weights = {
@@ -141,22 +304,31 @@ class MLAnalyzer:
             'closeness_centrality': 0.05
         }
         
-        impact_score = np.zeros(len(self.feature_df))
+        # Ağırlık vektörü feature_cols sırasıyla hizalanır (ağırlığı olmayan özellikler 0);
+        # ağırlıklı toplam tek bir matris-vektör çarpımıyla hesaplanır
+        w = np.array([weights.get(col, 0.0) for col in feature_cols], dtype=np.float32)
         
-        # Her özelliği ağırlığıyla çarp ve topla
-        for i, col in enumerate(feature_cols):
-            if col in weights:
-                impact_score += X_scaled[:, i] * weights[col]
-        
-        # Min-max normalizasyonu (0-100 arası skala)
-        if impact_score.max() > impact_score.min():
-            impact_score = (impact_score - impact_score.min()) / (impact_score.max() - impact_score.min()) * 100
+        if NUMBA_AVAILABLE and len(X_scaled) >= NUMBA_MIN_AUTHORS:
+            # Büyük veri setlerinde toplam ve ölçekleme tek geçişte yapılır
+            impact_score = _impact_score_numba(X_scaled.astype(np.float32, copy=False), w)
         else:
-            impact_score = np.zeros(len(impact_score))
+            impact_score = X_scaled @ w
+            
+            # Min-max normalizasyonu (0-100 arası skala), yerinde
+            score_range = np.ptp(impact_score)
+            if score_range > 0:
+                np.subtract(impact_score, impact_score.min(), out=impact_score)
+                np.divide(impact_score, score_range / 100, out=impact_score)
+            else:
+                impact_score = np.zeros(len(impact_score))
         
         self.feature_df['impact_score'] = impact_score
         
-        return self.feature_df.sort_values('impact_score', ascending=False)
+        # Sıralama permütasyonu bir kez hesaplanır ve saklanır; feature_df'in satır
+        # sırası değişmez, get_top_influential_authors aynı permütasyonu kullanır
+        self._impact_order = np.argsort(-impact_score, kind='stable')
+        
+        return self.feature_df.iloc[self._impact_order]
     
     def predict_citations(self, test_size: float = 0.2, models: List[str] = None) -> Dict:
         """
@@ -169,11 +341,20 @@ class MLAnalyzer:
         - 'rf': Random Forest Regressor
         - 'lgbm': LightGBM Regressor
         - 'dt': Decision Tree Regressor
-        - 'svm': Support Vector Machine (SVR)
+        
+        LightGBM erken durdurma ile eğitilir; doğrulama seti eğitim setinden
+        ayrılır, test seti model seçiminde kullanılmaz.
+        
+        SMALL_SAMPLE_AUTHORS'tan az yazar varsa %20'lik test seti güvenilir
+        metrikler için çok küçük kalır; bu durumda istenen modellerden biri
+        (CV_MODEL_PREFERENCE sırasıyla, öncelik LightGBM) K-fold CV ile
+        değerlendirilir ve metrikleri tüm yazarların fold dışı tahminlerinden
+        hesaplanır. Diğer modeller her zamanki gibi tek train-test ayrımıyla
+        eğitilir; predictions/actual tüm modeller için test setine karşılık gelir.
         
         Args:
             test_size: Test seti oranı (varsayılan: 0.2 = %20)
-            models: Eğitilecek model listesi (varsayılan: ['rf', 'lgbm', 'dt', 'svm'])
+            models: Eğitilecek model listesi (varsayılan: ['rf', 'lgbm', 'dt'])
             
         Returns:
             Tüm modellerin sonuçlarını içeren dict:
@@ -184,113 +365,150 @@ class MLAnalyzer:
             - predictions: Her model için tahmin edilen değerler
             - actual: Gerçek değerler
         """
-        if self.feature_df is None:
-            self.create_features()
-        
         # Varsayılan modeller
         if models is None:
             models = ['rf', 'lgbm', 'dt']
         
-        # Özellikleri seç (total_citations ve impact_score hariç - bunlar hedef/çıktı)
-        feature_cols = [col for col in self.feature_df.columns 
-                       if col not in ['author_name', 'total_citations', 'impact_score']]
+        # Özellikleri seç (total_citations hariç - bu hedef değişken).
+        # Ağaç modelleri ölçeklemeden etkilenmediğinden ham float32 matris kullanılır;
+        # feature_df eksik değerleri create_features'ta doldurulmuştur.
+        feature_cols, X = self._feature_matrix(ml_features=True, scaled=False)
+        y = self._y
         
-        X = self.feature_df[feature_cols].fillna(0).values
-        y = self.feature_df['total_citations'].fillna(0).values
-        
-        # Veriyi train-test olarak ayır
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=test_size, random_state=42
+        # Eğitilebilecek modelleri belirle (bilinmeyen/yüklü olmayanlar atlanır)
+        runnable_models = []
+        for model_name in models:
+            if model_name not in MODEL_NAMES:
+                print(f"  [WARNING] Bilinmeyen model: {model_name}")
+            elif model_name == 'lgbm' and not LIGHTGBM_AVAILABLE:
+                print(f"  [WARNING] {model_name.upper()} atlandi (kutuphane yuklu degil)")
+            else:
+                runnable_models.append(model_name)
+        
+        # Küçük veri setlerinde tek bir model ayrıca K-fold CV ile değerlendirilir
+        cv_model = None
+        if len(y) < SMALL_SAMPLE_AUTHORS:
+            # Her fold'un eğitim kısmında en az 2 yazar kalmalı (LightGBM alt sınırı)
+            if len(y) < 3:
+                print(f"  [WARNING] Model egitimi icin yeterli yazar yok ({len(y)})")
+                return self._summarize_predictions([], y, feature_cols)
+            cv_model = next((name for name in CV_MODEL_PREFERENCE if name in runnable_models), None)
+            if cv_model is not None:
+                print(f"  [INFO] {len(y)} yazar: {cv_model.upper()} "
+                      f"{min(SMALL_SAMPLE_FOLDS, len(y))}-fold CV ile degerlendiriliyor")
+        
+        # Veriyi train-test olarak ayır (indeksler üzerinden)
+        train_idx, test_idx = train_test_split(
+            np.arange(len(y)), test_size=test_size, random_state=42
         )
+        X_train, X_test = X[train_idx], X[test_idx]
+        y_train, y_test = y[train_idx], y[test_idx]
         
-        # Özellikleri normalize et (SVM için gerekli)
-        X_train_scaled = self.scaler.fit_transform(X_train)
-        X_test_scaled = self.scaler.transform(X_test)
+        # Modeller thread'lerde eşzamanlı eğitilir (ağaç eğitimi GIL'i bırakır);
+        # çekirdekler modeller arasında paylaştırılır, iç içe aşırı abonelik olmaz
+        n_cpus = os.cpu_count() or 1
+        n_workers = max(1, min(len(runnable_models), n_cpus))
+        model_jobs = max(1, n_cpus // n_workers)
+        
+        # Ağaç sayısı ve derinlik eğitim seti boyutundan bir kez türetilir
+        n_estimators, max_depth = _tree_capacity(len(X_train))
+        
+        def fit_one(model_name):
+            try:
+                model, y_pred = self._fit_model(
+                    model_name, X_train, y_train, X_test, model_jobs,
+                    n_estimators=n_estimators, max_depth=max_depth
+                )
+                return model_name, model, y_pred, None
+            except Exception as e:
+                return model_name, None, None, e
+        
+        # CV metrikleri tüm yazarlar üzerinden hesaplanır; döndürülen tahminler
+        # diğer modellerle aynı test satırlarına karşılık gelir
+        cv_scores = {}
+        
+        def cross_validate_one(model_name):
+            try:
+                model, oof_pred, cv_scores[model_name] = self._cross_validate_small(
+                    X, y, model_name, model_jobs,
+                    n_estimators=n_estimators, max_depth=max_depth
+                )
+                return model_name, model, oof_pred[test_idx], None
+            except Exception as e:
+                return model_name, None, None, e
+        
+        # Model kütüphanelerinin UserWarning'leri (ör. LightGBM parametre uyarıları) ve
+        # FutureWarning'leri (LightGBM 4.7+ eval_set'i kullanımdan kaldırıyor, ancak
+        # desteklenen 4.1+ sürümlerinin hepsinde çalışan tek parametre bu) sadece
+        # eğitim süresince bastırılır. Filtre thread'ler başlamadan önce ana thread'de
+        # bir kez kurulur; ConvergenceWarning gibi diğer uyarılar görünür kalır.
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=UserWarning)
+            warnings.simplefilter('ignore', category=FutureWarning)
+            fitted = Parallel(n_jobs=n_workers, prefer='threads')(
+                delayed(cross_validate_one if model_name == cv_model else fit_one)(model_name)
+                for model_name in runnable_models
+            )
+        
+        return self._summarize_predictions(fitted, y_test, feature_cols, cv_scores)
+    
+    def _summarize_predictions(
+        self,
+        fitted: List,
+        y_true: np.ndarray,
+        feature_cols,
+        cv_scores: Dict = None
+    ) -> Dict:
+        """
+        Eğitilmiş modellerin tahminlerini puanlar ve en iyi modeli seçer
         
+        Args:
+            fitted: (model adı, model, tahminler, hata) dörtlüleri
+            y_true: Tahminlere karşılık gelen gerçek değerler
+            feature_cols: Model özellik adları
+            cv_scores: K-fold CV ile değerlendirilen modellerin (R², RMSE) değerleri;
+                       bu modellerin metrikleri test seti yerine buradan alınır
+            
+        Returns:
+            predict_citations'ın döndürdüğü sonuç dict'i
+        """
         # Model sonuçlarını saklamak için dict
         results = {}
         trained_models = {}
         all_predictions = {}
         
-        # Her modeli eğit ve değerlendir
-        for model_name in models:
-            try:
-                if model_name == 'rf':
-                    # Random Forest Regressor
-                    model = RandomForestRegressor(
-                        n_estimators=100,
-                        max_depth=10,
-                        random_state=42,
-                        n_jobs=-1
-                    )
-                    model.fit(X_train_scaled, y_train)
-                    y_pred = model.predict(X_test_scaled)
-                    feature_importance = model.feature_importances_
-                    
-                elif model_name == 'lgbm':
-                    # LightGBM Regressor
-                    if not LIGHTGBM_AVAILABLE:
-                        print(f"  [WARNING] {model_name.upper()} atlandi (kutuphane yuklu degil)")
-                        continue
-                    model = lgb.LGBMRegressor(
-                        n_estimators=100,
-                        max_depth=10,
-                        learning_rate=0.1,
-                        random_state=42,
-                        n_jobs=-1,
-                        verbose=-1
-                    )
-                    model.fit(X_train_scaled, y_train)
-                    y_pred = model.predict(X_test_scaled)
-                    feature_importance = model.feature_importances_
-                    
-                elif model_name == 'dt':
-                    # Decision Tree Regressor
-                    model = DecisionTreeRegressor(
-                        max_depth=10,
-                        random_state=42
-                    )
-                    model.fit(X_train_scaled, y_train)
-                    y_pred = model.predict(X_test_scaled)
-                    feature_importance = model.feature_importances_
-                    
-                elif model_name == 'svm':
-                    # Support Vector Machine (SVR)
-                    model = SVR(
-                        kernel='rbf',
-                        C=1.0,
-                        epsilon=0.1
-                    )
-                    model.fit(X_train_scaled, y_train)
-                    y_pred = model.predict(X_test_scaled)
-                    # SVM'de feature_importance yok, bu yüzden None
-                    feature_importance = None
-                    
-                else:
-                    print(f"  [WARNING] Bilinmeyen model: {model_name}")
-                    continue
-                
-                # Model performans metrikleri
-                r2 = r2_score(y_test, y_pred)
-                rmse = np.sqrt(mean_squared_error(y_test, y_pred))
-                
-                results[model_name] = {
-                    'r2_score': r2,
-                    'rmse': rmse,
-                    'model_name': model_name.upper()
-                }
-                trained_models[model_name] = model
-                all_predictions[model_name] = y_pred
-                
-                print(f"  [OK] {model_name.upper()}: R^2 = {r2:.4f}, RMSE = {rmse:.2f}")
-                
-            except Exception as e:
-                print(f"  [ERROR] {model_name.upper()} hatasi: {str(e)}")
+        # Her modeli değerlendir (model listesindeki sırayla)
+        for model_name, model, y_pred, error in fitted:
+            if error is not None:
+                print(f"  [ERROR] {model_name.upper()} hatasi: {str(error)}")
                 continue
+            
+            # Model performans metrikleri
+            if cv_scores and model_name in cv_scores:
+                r2, rmse = cv_scores[model_name]
+                label = f"{model_name.upper()} (CV)"
+            else:
+                # Tek örnekli test setinde R² tanımsızdır (NaN olarak raporlanır)
+                r2 = r2_score(y_true, y_pred) if len(y_true) >= 2 else np.nan
+                rmse = np.sqrt(mean_squared_error(y_true, y_pred))
+                label = model_name.upper()
+            
+            results[model_name] = {
+                'r2_score': r2,
+                'rmse': rmse,
+                'model_name': model_name.upper()
+            }
+            trained_models[model_name] = model
+            all_predictions[model_name] = y_pred
+            
+            print(f"  [OK] {label}: R^2 = {r2:.4f}, RMSE = {rmse:.2f}")
         
-        # En iyi modeli bul (R² skoruna göre)
+        # En iyi modeli bul (R² skoruna göre; tanımsız R²'ler en sona)
         if results:
-            best_model_name = max(results.keys(), key=lambda x: results[x]['r2_score'])
+            best_model_name = max(
+                results.keys(),
+                key=lambda x: -np.inf if np.isnan(results[x]['r2_score']) else results[x]['r2_score']
+            )
             best_model = trained_models[best_model_name]
             
             # En iyi modelin feature importance'sini al
@@ -315,10 +533,144 @@ class MLAnalyzer:
             'models': trained_models,
             'feature_importance': feature_importance_df,
             'predictions': all_predictions,
-            'actual': y_test,
-            'feature_names': feature_cols
+            'actual': y_true,
+            'feature_names': list(feature_cols)
         }
     
+    def _cross_validate_small(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        model_name: str,
+        n_jobs: int,
+        n_estimators: int,
+        max_depth: int
+    ):
+        """
+        Küçük yazar kümelerinde tek bir modeli K-fold CV ile değerlendirir
+        
+        Birkaç düzine yazarda %20'lik test seti 10 kişiden azdır ve metrikleri
+        gürültülüdür. Model her fold'da eğitilir ve her yazar için fold dışı
+        (out-of-fold) tahmin üretilir; metrikler bu tahminlerin tamamı üzerinden
+        hesaplanır (tek örnekli fold'larda R² tanımsız olduğundan fold ortalaması
+        yerine). Son model tüm veriyle eğitilir.
+        
+        Args:
+            X: Özellik matrisi (hedef hariç)
+            y: Hedef değerleri
+            model_name: Model kısaltması
+            n_jobs: Modelin kullanabileceği thread sayısı
+            n_estimators: Ağaç sayısı
+            max_depth: Ağaçların maksimum derinliği
+            
+        Returns:
+            (tüm veriyle eğitilmiş model, fold dışı tahminler, (R², RMSE)) üçlüsü
+        """
+        n_samples = len(y)
+        oof_pred = np.empty(n_samples, dtype=np.float64)
+        kf = KFold(n_splits=min(SMALL_SAMPLE_FOLDS, n_samples), shuffle=True, random_state=42)
+        
+        for train_idx, test_idx in kf.split(X):
+            _, oof_pred[test_idx] = self._fit_model(
+                model_name, X[train_idx], y[train_idx], X[test_idx], n_jobs,
+                n_estimators=n_estimators, max_depth=max_depth
+            )
+        
+        # Son model tüm veriyle eğitilir (özellik önemleri ve sonraki tahminler için)
+        model, _ = self._fit_model(
+            model_name, X, y, X[:1], n_jobs,
+            n_estimators=n_estimators, max_depth=max_depth
+        )
+        
+        r2 = r2_score(y, oof_pred)
+        rmse = np.sqrt(mean_squared_error(y, oof_pred))
+        return model, oof_pred, (r2, rmse)
+    
+    def _fit_model(
+        self,
+        model_name: str,
+        X_train: np.ndarray,
+        y_train: np.ndarray,
+        X_test: np.ndarray,
+        n_jobs: int = -1,
+        n_estimators: int = 100,
+        max_depth: int = 10
+    ):
+        """
+        Tek bir regresyon modelini eğitir ve test seti için tahmin üretir
+        
+        Args:
+            model_name: Model kısaltması ('rf', 'lgbm', 'dt')
+            X_train: Eğitim özellikleri
+            y_train: Eğitim hedef değerleri
+            X_test: Test özellikleri
+            n_jobs: Modelin kullanabileceği thread sayısı
+            n_estimators: Random Forest ağaç sayısı (LightGBM'de erken durdurma
+                          yapılmayan küçük setlerde de kullanılır)
+            max_depth: Ağaçların maksimum derinliği
+            
+        Returns:
+            (eğitilmiş model, test tahminleri) ikilisi
+        """
+        if model_name == 'rf':
+            # Random Forest Regressor
+            model = RandomForestRegressor(
+                n_estimators=n_estimators,
+                max_depth=max_depth,
+                random_state=42,
+                n_jobs=n_jobs
+            )
+            model.fit(X_train, y_train)
+            
+        elif model_name == 'lgbm':
+            # LightGBM Regressor
+            # Yeterli veri varsa eğitim setinin bir kısmı erken durdurma için
+            # doğrulama olarak ayrılır; ağaç sayısı üst sınırdır, gerçek sayıyı
+            # erken durdurma belirler. Küçük setlerde tüm satırlarla n_estimators
+            # ağaç eğitilir (ayrılan birkaç satır hem eğitimi hem doğrulamayı bozar).
+            early_stopping = len(X_train) >= LGBM_EARLY_STOPPING_MIN_ROWS
+            if early_stopping:
+                X_fit, X_val, y_fit, y_val = train_test_split(
+                    X_train, y_train, test_size=LGBM_VALIDATION_SIZE, random_state=42
+                )
+            else:
+                X_fit, y_fit = X_train, y_train
+            
+            # Varsayılan min_child_samples=20 ile 40 satırdan küçük setlerde hiç
+            # bölünme yapılamaz ve model sabit tahmine düşer; satır sayısıyla ölçeklenir
+            min_child_samples = min(LGBM_MIN_CHILD_SAMPLES, max(2, len(X_fit) // 10))
+            
+            model = lgb.LGBMRegressor(
+                boosting_type='gbdt',
+                n_estimators=MAX_ESTIMATORS if early_stopping else n_estimators,
+                num_leaves=31,
+                max_depth=max_depth,
+                learning_rate=0.05,
+                min_child_samples=min_child_samples,
+                min_data_in_bin=min(3, min_child_samples),
+                random_state=42,
+                n_jobs=n_jobs,
+                verbose=-1
+            )
+            if early_stopping:
+                model.fit(
+                    X_fit, y_fit,
+                    eval_set=[(X_val, y_val)],
+                    callbacks=[lgb.early_stopping(LGBM_EARLY_STOPPING_ROUNDS, verbose=False)]
+                )
+            else:
+                model.fit(X_fit, y_fit)
+            
+        else:
+            # Decision Tree Regressor
+            model = DecisionTreeRegressor(
+                max_depth=max_depth,
+                random_state=42
+            )
+            model.fit(X_train, y_train)
+        
+        return model, model.predict(X_test)
+    
     def cluster_authors(self, n_clusters: int = 5, method: str = 'kmeans') -> pd.DataFrame:
         """
         Yazarları benzerliklerine göre kümeleme
@@ -333,14 +685,7 @@ class MLAnalyzer:
         Returns:
             Küme bilgileri eklenmiş DataFrame (cluster, pca_1, pca_2 kolonları ile)
         """
-        if self.feature_df is None:
-            self.create_features()
-        
-        feature_cols = [col for col in self.feature_df.columns 
-                       if col not in ['author_name', 'total_citations', 'impact_score']]
-        
-        X = self.feature_df[feature_cols].fillna(0).values
-        X_scaled = self.scaler.fit_transform(X)
+        feature_cols, X_scaled = self._feature_matrix(ml_features=True)
         
         # Küme sayısını örnek sayısına göre ayarla
         n_samples = X_scaled.shape[0]
@@ -348,24 +693,28 @@ class MLAnalyzer:
             n_clusters = max(1, n_samples)
             print(f"  [WARNING] Kume sayisi ornek sayisina ({n_samples}) ayarlandi: {n_clusters}")
         
-        # Kümeleme algoritması seçimi
-        if method == 'kmeans':
-            clusterer = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
-            clusters = clusterer.fit_predict(X_scaled)
-        elif method == 'dbscan':
+        # Kümeleme algoritması seçimi (bilinmeyen yöntemlerde KMeans);
+        # büyük veri setlerinde KMeans mini-batch'lerle çalıştırılır
+        if method == 'dbscan':
             clusterer = DBSCAN(eps=0.5, min_samples=3)
-            clusters = clusterer.fit_predict(X_scaled)
+        elif n_samples > MINIBATCH_KMEANS_MIN_AUTHORS:
+            clusterer = MiniBatchKMeans(
+                n_clusters=n_clusters,
+                batch_size=MINIBATCH_KMEANS_BATCH_SIZE,
+                n_init=3,
+                random_state=42
+            )
         else:
             clusterer = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
-            clusters = clusterer.fit_predict(X_scaled)
+        clusters = clusterer.fit_predict(X_scaled)
         
         self.feature_df['cluster'] = clusters
         
         # PCA ile görselleştirme için boyut azaltma (2 boyuta indir)
-        # Yüksek boyutlu özellikleri 2D'ye indirir (görselleştirme için)
+        # Yüksek boyutlu özellikleri 2D'ye indirir (görselleştirme için);
+        # standartlaştırılmış matris zaten ortalanmış olduğundan doğrudan izdüşürülür
         if X_scaled.shape[1] > 2:
-            pca = PCA(n_components=2)
-            X_pca = pca.fit_transform(X_scaled)
+            X_pca = _project_2d(X_scaled)
             self.feature_df['pca_1'] = X_pca[:, 0]
             self.feature_df['pca_2'] = X_pca[:, 1]
         else:
@@ -385,13 +734,14 @@ class MLAnalyzer:
         Returns:
             En etkili yazarları içeren DataFrame
         """
-        if self.feature_df is None or 'impact_score' not in self.feature_df.columns:
+        if self._impact_order is None:
             self.calculate_impact_score()
         
-        # Duplicate'leri kaldır (her yazar için sadece bir satır)
-        feature_df_unique = self.feature_df.drop_duplicates(subset=['author_name'], keep='first')
+        # feature_df create_features'ta yazar başına tek satıra indirilmiştir;
+        # calculate_impact_score'un sakladığı sıralama yeniden sıralamadan kullanılır
+        top_idx = self._impact_order[:max(top_n, 0)]
         
-        return feature_df_unique.nlargest(top_n, 'impact_score')[
+        return self.feature_df.iloc[top_idx][
             ['author_name', 'impact_score', 'total_citations', 
              'publication_count', 'h_index_approx', 'pagerank']
         ]
@@ -0,0 +1,47 @@
+"""
+ScholarDataCollector testleri
+"""
+
+import sys
+from pathlib import Path
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data_collector import ScholarDataCollector
+
+
+def test_load_from_csv_keeps_rows_with_non_string_authors(tmp_path):
+    """String olmayan yazar elemanı içeren satırlar CSV yüklemesini boşaltmamalı"""
+    csv_file = tmp_path / "publications.csv"
+    csv_file.write_text(
+        "title,abstract,authors,citation_count,pub_url\n"
+        "T1,x,\"['A', 1]\",3,u1\n"
+        "T2,y,\"['B']\",1,u2\n",
+        encoding="utf-8"
+    )
+
+    df = ScholarDataCollector().load_from_csv(str(csv_file))
+
+    assert len(df) == 2
+    assert list(df['authors'].iloc[0]) == ['A', 1]
+    assert list(df['authors'].iloc[1]) == ['B']
+
+
+def test_search_publications_repeated_calls_return_same_papers(monkeypatch):
+    """Toplama dışındaki ardışık aramalar önceki aramanın paperId'lerini atlamamalı"""
+    page = {
+        'total': 2,
+        'data': [
+            {'paperId': 'p1', 'title': 'Paper 1', 'authors': [{'name': 'A'}], 'citationCount': 1},
+            {'paperId': 'p2', 'title': 'Paper 2', 'authors': [{'name': 'B'}], 'citationCount': 2}
+        ]
+    }
+    collector = ScholarDataCollector()
+    monkeypatch.setattr(collector, '_api_request', lambda endpoint, params: page)
+
+    first = collector.search_publications("query", max_results=10)
+    second = collector.search_publications("query", max_results=10)
+
+    assert [pub['title'] for pub in first] == ['Paper 1', 'Paper 2']
+    assert [pub['title'] for pub in second] == ['Paper 1', 'Paper 2']